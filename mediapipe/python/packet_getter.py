@@ -14,7 +14,10 @@
 
 """The public facing packet getter APIs."""
 
-from typing import List
+import functools
+from typing import List, Optional, Type
+
+import numpy as np
 
 from google.protobuf import message
 from google.protobuf import symbol_database
@@ -38,6 +41,29 @@ get_image = _packet_getter.get_image
 get_image_frame = _packet_getter.get_image_frame
 get_matrix = _packet_getter.get_matrix
 
+NUM_HAND_LANDMARKS = 21
+
+# The wire layout of one landmark entry of a (Normalized)LandmarkList with
+# only x, y and z set, which is what the landmark calculators emit: the
+# length-delimited landmark field (tag 0x0a, length 15) holding three fixed32
+# floats tagged 0x0d, 0x15 and 0x1d.
+_LANDMARK_ENTRY_SIZE = 17
+_LANDMARK_TAG_COLUMNS = np.array([0, 1, 2, 7, 12])
+_LANDMARK_TAG_BYTES = np.array([0x0a, 15, 0x0d, 0x15, 0x1d], dtype=np.uint8)
+_LANDMARK_FLOAT_COLUMNS = np.r_[3:7, 8:12, 13:17]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_message_class(proto_type_name: str) -> Type[message.Message]:
+  """Looks up the message class of a proto type name once per type name."""
+  try:
+    descriptor = symbol_database.Default().pool.FindMessageTypeByName(
+        proto_type_name)
+  except KeyError:
+    raise TypeError('Can not find message descriptor by type name: %s' %
+                    proto_type_name)
+  return symbol_database.Default().GetPrototype(descriptor)
+
 
 def get_proto(packet: mp_packet.Packet) -> message.Message:
   """Get the content of a MediaPipe proto Packet as a proto message.
@@ -60,14 +86,7 @@ def get_proto(packet: mp_packet.Packet) -> message.Message:
   # pylint:disable=protected-access
   proto_type_name = _packet_getter._get_proto_type_name(packet)
   # pylint:enable=protected-access
-  try:
-    descriptor = symbol_database.Default().pool.FindMessageTypeByName(
-        proto_type_name)
-  except KeyError:
-    raise TypeError('Can not find message descriptor by type name: %s' %
-                    proto_type_name)
-
-  message_class = symbol_database.Default().GetPrototype(descriptor)
+  message_class = _get_message_class(proto_type_name)
   # pylint:disable=protected-access
   serialized_proto = _packet_getter._get_serialized_proto(packet)
   # pylint:enable=protected-access
@@ -101,19 +120,130 @@ def get_proto_list(packet: mp_packet.Packet) -> List[message.Message]:
   # pylint:disable=protected-access
   proto_type_name = _packet_getter._get_proto_vector_element_type_name(packet)
   # pylint:enable=protected-access
-  try:
-    descriptor = symbol_database.Default().pool.FindMessageTypeByName(
-        proto_type_name)
-  except KeyError:
-    raise TypeError('Can not find message descriptor by type name: %s' %
-                    proto_type_name)
-  message_class = symbol_database.Default().GetPrototype(descriptor)
+  message_class = _get_message_class(proto_type_name)
   # pylint:disable=protected-access
   serialized_protos = _packet_getter._get_serialized_proto_list(packet)
   # pylint:enable=protected-access
-  proto_message_list = []
-  for serialized_proto in serialized_protos:
-    proto_message = message_class()
-    proto_message.ParseFromString(serialized_proto)
-    proto_message_list.append(proto_message)
-  return proto_message_list
+  return [
+      message_class.FromString(serialized_proto)
+      for serialized_proto in serialized_protos
+  ]
+
+
+def get_landmark_array(packet: mp_packet.Packet) -> np.ndarray:
+  """Get the content of a MediaPipe landmark list Packet as a numpy array.
+
+  Args:
+    packet: A MediaPipe NormalizedLandmarkList or LandmarkList proto Packet.
+
+  Returns:
+    A float32 numpy array of shape (num_landmarks, 3) holding the x, y and z
+    coordinates of each landmark.
+
+  Raises:
+    TypeError: If the message descriptor can't be found by type name.
+
+  Examples:
+    landmarks = mp.packet_getter.get_landmark_array(landmarks_packet)
+  """
+  # pylint:disable=protected-access
+  proto_type_name = _packet_getter._get_proto_type_name(packet)
+  serialized_proto = _packet_getter._get_serialized_proto(packet)
+  # pylint:enable=protected-access
+  num_landmarks, remainder = divmod(
+      len(serialized_proto), _LANDMARK_ENTRY_SIZE)
+  landmarks = None
+  if not remainder:
+    landmarks = _landmarks_from_wire([serialized_proto], num_landmarks)
+  if landmarks is None:
+    # Any other layout (e.g. with visibility or presence set) goes through
+    # the regular proto parser.
+    landmarks = _landmarks_from_messages([serialized_proto], None,
+                                         proto_type_name)
+  return landmarks[0]
+
+
+def get_landmark_list_array(
+    packet: mp_packet.Packet,
+    num_landmarks: int = NUM_HAND_LANDMARKS) -> np.ndarray:
+  """Get the content of a MediaPipe landmark list vector Packet as a numpy array.
+
+  Unlike get_proto_list(), no proto message objects are built for lists in the
+  layout the landmark calculators emit; their coordinates are read straight
+  from the serialized bytes.
+
+  Args:
+    packet: A MediaPipe NormalizedLandmarkList or LandmarkList proto vector
+      Packet, e.g. the multi_hand_landmarks output of the hands graph.
+    num_landmarks: The number of landmarks in every list.
+
+  Returns:
+    A float32 numpy array of shape (num_lists, num_landmarks, 3) holding the
+    x, y and z coordinates of each landmark.
+
+  Raises:
+    TypeError: If the message descriptor can't be found by type name.
+    ValueError: If a list doesn't contain num_landmarks landmarks.
+
+  Examples:
+    hand_landmarks = mp.packet_getter.get_landmark_list_array(
+        multi_hand_landmarks_packet)
+  """
+  # pylint:disable=protected-access
+  vector_size = _packet_getter._get_proto_vector_size(packet)
+  # pylint:enable=protected-access
+  if vector_size == 0:
+    return np.zeros((0, num_landmarks, 3), dtype=np.float32)
+  # pylint:disable=protected-access
+  proto_type_name = _packet_getter._get_proto_vector_element_type_name(packet)
+  serialized_protos = list(_packet_getter._get_serialized_proto_list(packet))
+  # pylint:enable=protected-access
+  landmarks = _landmarks_from_wire(serialized_protos, num_landmarks)
+  if landmarks is None:
+    landmarks = _landmarks_from_messages(serialized_protos, num_landmarks,
+                                         proto_type_name)
+  return landmarks
+
+
+def _landmarks_from_wire(serialized_protos: List[bytes],
+                        num_landmarks: int) -> Optional[np.ndarray]:
+  """Reads landmark lists in the x/y/z-only wire layout without parsing them.
+
+  Returns None if any list is in a different layout.
+  """
+  list_size = num_landmarks * _LANDMARK_ENTRY_SIZE
+  if any(len(serialized) != list_size for serialized in serialized_protos):
+    return None
+  entries = np.frombuffer(
+      b''.join(serialized_protos), dtype=np.uint8).reshape(
+          -1, _LANDMARK_ENTRY_SIZE)
+  if not (entries[:, _LANDMARK_TAG_COLUMNS] == _LANDMARK_TAG_BYTES).all():
+    return None
+  coordinates = np.ascontiguousarray(entries[:, _LANDMARK_FLOAT_COLUMNS])
+  return coordinates.view('<f4').astype(np.float32, copy=False).reshape(
+      len(serialized_protos), num_landmarks, 3)
+
+
+def _landmarks_from_messages(serialized_protos: List[bytes],
+                             num_landmarks: Optional[int],
+                             proto_type_name: str) -> np.ndarray:
+  """Parses landmark lists with the regular proto parser.
+
+  If num_landmarks is None, it is taken from the first list.
+  """
+  message_class = _get_message_class(proto_type_name)
+  landmark_lists = [
+      message_class.FromString(serialized).landmark
+      for serialized in serialized_protos
+  ]
+  if num_landmarks is None:
+    num_landmarks = len(landmark_lists[0]) if landmark_lists else 0
+  landmarks = np.empty((len(landmark_lists), num_landmarks, 3),
+                       dtype=np.float32)
+  for i, landmark_list in enumerate(landmark_lists):
+    if len(landmark_list) != num_landmarks:
+      raise ValueError('Expected %d landmarks in a %s, got %d.' %
+                       (num_landmarks, proto_type_name, len(landmark_list)))
+    for j, landmark in enumerate(landmark_list):
+      landmarks[i, j] = (landmark.x, landmark.y, landmark.z)
+  return landmarks
@@ -22,6 +22,7 @@ import numpy as np
 
 from google.protobuf import text_format
 from mediapipe.framework.formats import detection_pb2
+from mediapipe.framework.formats import landmark_pb2
 from mediapipe.python import packet_creator
 from mediapipe.python import packet_getter
 from mediapipe.python._framework_bindings import calculator_graph
@@ -177,6 +178,47 @@ class PacketTest(absltest.TestCase):
     text_format.Parse('score: 0.5', detection)
     p = packet_creator.create_proto(detection).at(100)
 
+  def test_landmark_list_proto_packet(self):
+    expected = np.random.rand(21, 3).astype(np.float32)
+    expected[0] = 0
+    landmark_list = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in expected:
+      landmark_list.landmark.add(x=x, y=y, z=z)
+    p = packet_creator.create_proto(landmark_list).at(100)
+    output_array = packet_getter.get_landmark_array(p)
+    self.assertEqual(output_array.dtype, np.float32)
+    self.assertTrue(np.array_equal(output_array, expected))
+    self.assertEqual(packet_getter.get_proto(p), landmark_list)
+    # Landmarks with visibility take the regular proto parsing path.
+    landmark_list.landmark[3].visibility = 0.5
+    p = packet_creator.create_proto(landmark_list).at(100)
+    self.assertTrue(
+        np.array_equal(packet_getter.get_landmark_array(p), expected))
+
+  def test_landmark_list_vector_wire_decoding(self):
+    expected = np.random.rand(3, 21, 3).astype(np.float32)
+    serialized_lists = []
+    for hand in expected:
+      landmark_list = landmark_pb2.NormalizedLandmarkList()
+      for x, y, z in hand:
+        landmark_list.landmark.add(x=x, y=y, z=z)
+      serialized_lists.append(landmark_list.SerializeToString())
+    # pylint:disable=protected-access
+    output_array = packet_getter._landmarks_from_wire(serialized_lists, 21)
+    self.assertEqual(output_array.shape, (3, 21, 3))
+    self.assertTrue(np.array_equal(output_array, expected))
+    self.assertIsNone(packet_getter._landmarks_from_wire(serialized_lists, 20))
+    landmark_list.landmark[0].presence = 0.9
+    serialized_lists[-1] = landmark_list.SerializeToString()
+    self.assertIsNone(packet_getter._landmarks_from_wire(serialized_lists, 21))
+    output_array = packet_getter._landmarks_from_messages(
+        serialized_lists, 21, 'mediapipe.NormalizedLandmarkList')
+    self.assertTrue(np.array_equal(output_array, expected))
+    with self.assertRaisesRegex(ValueError, 'Expected 20 landmarks'):
+      packet_getter._landmarks_from_messages(
+          serialized_lists, 20, 'mediapipe.NormalizedLandmarkList')
+    # pylint:enable=protected-access
+
   def test_string_packet(self):
     p = packet_creator.create_string('abc').at(100)
     self.assertEqual(packet_getter.get_str(p), 'abc')
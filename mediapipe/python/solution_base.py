@@ -22,9 +22,12 @@ class.
 """
 
 import collections
+from concurrent import futures
 import enum
 import os
-from typing import Any, Iterable, List, Mapping, NamedTuple, Optional, Union
+import threading
+import time
+from typing import Any, Callable, FrozenSet, Iterable, List, Mapping, Optional, Union
 
 import numpy as np
 
@@ -57,6 +60,14 @@ from mediapipe.python._framework_bindings import resource_util
 from mediapipe.python._framework_bindings import validated_graph_config
 
 RGB_CHANNELS = 3
+# A process_async() result that the output callbacks have not settled after
+# ASYNC_STALL_FACTOR times the usual submit-to-settle latency (and at least
+# ASYNC_SETTLE_TIMEOUT_S) is treated as stalled, for graphs that don't propagate
+# timestamp bounds to every output, and settled by waiting for the graph to
+# become idle.
+ASYNC_SETTLE_TIMEOUT_S = 0.1
+ASYNC_STALL_FACTOR = 3.0
+ASYNC_LATENCY_SMOOTHING = 0.1
 # TODO: Enable calculator options modification for more calculators.
 CALCULATOR_TO_OPTIONS = {
     'ConstantSidePacketCalculator':
@@ -103,6 +114,9 @@ class PacketDataType(enum.Enum):
   IMAGE_FRAME = 'image_frame'
   PROTO = 'proto'
   PROTO_LIST = 'proto_list'
+  # Only as a stream type hint for NormalizedLandmarkList or LandmarkList
+  # vector streams, which then come out as (lists, landmarks, 3) arrays.
+  LANDMARK_LIST_ARRAY = 'landmark_list_array'
 
   @staticmethod
   def from_registered_name(registered_name: str) -> 'PacketDataType':
@@ -165,6 +179,82 @@ NAME_TO_TYPE: Mapping[str, 'PacketDataType'] = {
 }
 
 
+class SolutionOutputs:
+  """Base class of the result types returned by SolutionBase.process().
+
+  Each SolutionBase builds one subclass in __init__ with a field per observed
+  output stream, listed in _fields. Results are plain per-call instances, so
+  a result stays valid after later process() calls and can be handed to other
+  threads. A result holds the raw output packets and decodes each field on
+  first access, so fields the caller never reads are never deserialized.
+  """
+
+  __slots__ = ('_packets', '_values')
+  _fields = ()
+
+  def __init__(self, packets: Mapping[str, packet.Packet]):
+    self._packets = packets
+    self._values = {}
+
+  def _asdict(self) -> Mapping[str, Any]:
+    return {name: getattr(self, name) for name in self._fields}
+
+  def __iter__(self):
+    return (getattr(self, name) for name in self._fields)
+
+  def __repr__(self) -> str:
+    fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self._fields)
+    return f'{type(self).__name__}({fields})'
+
+
+def _lazy_output_field(
+    stream_name: str, packet_data_type: 'PacketDataType',
+    get_packet_content: Callable[['PacketDataType', packet.Packet], Any]
+) -> property:
+  """A SolutionOutputs field that decodes its packet once, on first access."""
+
+  def fget(outputs: SolutionOutputs) -> Any:
+    try:
+      return outputs._values[stream_name]  # pylint: disable=protected-access
+    except KeyError:
+      output_packet = outputs._packets.get(stream_name)  # pylint: disable=protected-access
+      value = None if output_packet is None else get_packet_content(
+          packet_data_type, output_packet)
+      outputs._values[stream_name] = value  # pylint: disable=protected-access
+      return value
+
+  def fset(outputs: SolutionOutputs, value: Any) -> None:
+    outputs._values[stream_name] = value  # pylint: disable=protected-access
+
+  return property(fget, fset, doc=f'The {stream_name!r} output stream.')
+
+
+def _make_outputs_type(
+    output_stream_type_info: Mapping[str, 'PacketDataType'],
+    get_packet_content: Callable[['PacketDataType', packet.Packet], Any]
+) -> type:
+  """Creates a SolutionOutputs subclass with one lazy field per output stream."""
+  namespace = {'__slots__': (), '_fields': tuple(output_stream_type_info)}
+  for stream_name, packet_data_type in output_stream_type_info.items():
+    namespace[stream_name] = _lazy_output_field(stream_name, packet_data_type,
+                                                get_packet_content)
+  return type('SolutionOutputs', (SolutionOutputs,), namespace)
+
+
+class _PendingFrame:
+  """An in-flight process_async() call waiting for its outputs."""
+
+  __slots__ = ('timestamp', 'packets', 'future', 'outputs', 'submitted')
+
+  def __init__(self, timestamp: int, future: futures.Future,
+               outputs: Optional[FrozenSet[str]]):
+    self.timestamp = timestamp
+    self.packets = {}
+    self.future = future
+    self.outputs = outputs
+    self.submitted = time.monotonic()
+
+
 class SolutionBase:
   """The common base class for the high-level MediaPipe Solution APIs.
 
@@ -191,7 +281,8 @@ class SolutionBase:
       graph_options: Optional[message.Message] = None,
       side_inputs: Optional[Mapping[str, Any]] = None,
       outputs: Optional[List[str]] = None,
-      stream_type_hints: Optional[Mapping[str, PacketDataType]] = None):
+      stream_type_hints: Optional[Mapping[str, PacketDataType]] = None,
+      max_in_flight: int = 2):
     """Initializes the SolutionBase object.
 
     Args:
@@ -206,6 +297,8 @@ class SolutionBase:
         is empty, all the output streams listed in the graph config will be
         automatically observed by default.
       stream_type_hints: A mapping from the stream name to its packet type hint.
+      max_in_flight: The maximum number of process_async() calls that may be
+        pending in the graph at once.
 
     Raises:
       FileNotFoundError: If the binary graph file can't be found.
@@ -247,14 +340,18 @@ class SolutionBase:
 
     self._graph = calculator_graph.CalculatorGraph(
         graph_config=canonical_graph_config_proto)
-    self._simulated_timestamp = 0
+    self._outputs_type = _make_outputs_type(self._output_stream_type_info,
+                                            self._get_packet_content)
+    self._timestamp_us = 0
     self._graph_outputs = {}
-
-    def callback(stream_name: str, output_packet: packet.Packet) -> None:
-      self._graph_outputs[stream_name] = output_packet
+    self.max_in_flight = max_in_flight
+    self._pending = collections.deque()
+    self._stream_progress = {}
+    self._settle_latency_s = 0.0
+    self._async_cond = threading.Condition()
 
     for stream_name in self._output_stream_type_info.keys():
-      self._graph.observe_output_stream(stream_name, callback, True)
+      self._graph.observe_output_stream(stream_name, self._on_output, True)
 
     self._input_side_packets = {
         name: self._make_packet(self._side_input_type_info[name], data)
@@ -266,26 +363,38 @@ class SolutionBase:
   # types from "_input_stream_type_info" and then auto generate the process
   # method signature by "inspect.Signature" in __init__.
   def process(
-      self, input_data: Union[np.ndarray, Mapping[str, Union[np.ndarray,
-                                                             message.Message]]]
-  ) -> NamedTuple:
+      self,
+      input_data: Union[np.ndarray, Mapping[str, Union[np.ndarray,
+                                                       message.Message]]],
+      timestamp_us: Optional[int] = None,
+      outputs: Optional[Iterable[str]] = None) -> SolutionOutputs:
     """Processes a set of RGB image data and output SolutionOutputs.
 
     Args:
       input_data: Either a single numpy ndarray object representing the solo
         image input of a graph or a mapping from the stream name to the image or
         proto data that represents every input streams of a graph.
+      timestamp_us: The capture time of the input data in microseconds, from a
+        monotonic clock. It must be greater than the timestamp of the previous
+        call. If None, the input is stamped 33333 us after the previous one, as
+        if it came from a 30 fps video.
+      outputs: The names of the output streams the caller is going to read. The
+        other fields of the result are None and their packets are never
+        decoded. If None, every output stream is available.
 
     Raises:
       NotImplementedError: If input_data contains audio data or a list of proto
         objects.
       RuntimeError: If the underlying graph occurs any error.
-      ValueError: If the input image data is not three channel RGB.
+      ValueError: If the input image data is not three channel RGB, if
+        timestamp_us is not greater than the previous input timestamp, or if
+        outputs names a stream that is not a graph output.
 
     Returns:
-      A NamedTuple object that contains the output data of a graph run.
-        The field names in the NamedTuple object are mapping to the graph output
-        stream names.
+      A SolutionOutputs object that contains the output data of a graph run.
+        The field names in the SolutionOutputs object are mapping to the graph
+        output stream names. Each field is decoded from its output packet the
+        first time it is read.
 
     Examples:
       solution = solution_base.SolutionBase(graph_config=hand_landmark_graph)
@@ -295,20 +404,108 @@ class SolutionBase:
           {'video_in' : cv2.imread('/tmp/hand1.png')[:, :, ::-1]})
       print(results.hand_landmarks)
     """
+    selected = self._select_outputs(outputs)
+    self._wait_for_pending()
     self._graph_outputs.clear()
+    self._add_inputs(
+        self._input_dict(input_data), self._next_timestamp(timestamp_us))
+    self._graph.wait_until_idle()
+    return self._make_outputs(self._graph_outputs, selected)
+
+  def process_async(
+      self,
+      input_data: Union[np.ndarray, Mapping[str, Union[np.ndarray,
+                                                       message.Message]]],
+      timestamp_us: Optional[int] = None,
+      outputs: Optional[Iterable[str]] = None) -> futures.Future:
+    """Sends a set of input data into the graph without waiting for the outputs.
+
+    Up to max_in_flight calls may be pending in the graph at once, so the
+    caller can prepare the next frame while the graph is still busy with the
+    previous one; beyond that the call blocks until the oldest one completes.
+    A call completes once every output stream has reported a packet or a
+    timestamp bound at or after its timestamp, and its future then holds the
+    same SolutionOutputs that process() would have returned. The graph's output
+    callbacks complete the future, so done() and done callbacks work without
+    calling result(); a frame some output never settles is completed once the
+    graph goes idle. Input arrays are referenced by the graph, so they must not
+    be modified before the future is done.
+
+    Args:
+      input_data: Either a single numpy ndarray object representing the solo
+        image input of a graph or a mapping from the stream name to the image or
+        proto data that represents every input streams of a graph.
+      timestamp_us: The capture time of the input data in microseconds, as in
+        process().
+      outputs: The names of the output streams the caller is going to read, as
+        in process().
+
+    Raises:
+      NotImplementedError: If input_data contains audio data or a list of proto
+        objects.
+      RuntimeError: If the underlying graph occurs any error.
+      ValueError: If the input image data is not three channel RGB, if
+        timestamp_us is not greater than the previous input timestamp, or if
+        outputs names a stream that is not a graph output.
+
+    Returns:
+      A concurrent.futures.Future whose result is the SolutionOutputs of this
+      input data. Results complete in input order.
 
+    Examples:
+      solution = solution_base.SolutionBase(graph_config=hand_landmark_graph)
+      pending = solution.process_async(frame0)
+      for frame in frames:
+        results = pending.result()
+        pending = solution.process_async(frame)
+    """
+    selected = self._select_outputs(outputs)
+    input_dict = self._input_dict(input_data)
+    while True:
+      with self._async_cond:
+        if len(self._pending) < max(self.max_in_flight, 1):
+          break
+        oldest = self._pending[0]
+      self._wait_for(oldest)
+    future = _SolutionFuture(self)
+    frame = _PendingFrame(self._next_timestamp(timestamp_us), future, selected)
+    with self._async_cond:
+      self._pending.append(frame)
+    try:
+      self._add_inputs(input_dict, frame.timestamp)
+    except Exception:
+      with self._async_cond:
+        self._pending.remove(frame)
+      raise
+    return future
+
+  def _input_dict(
+      self, input_data: Union[np.ndarray, Mapping[str, Union[np.ndarray,
+                                                             message.Message]]]
+  ) -> Mapping[str, Any]:
     if isinstance(input_data, np.ndarray):
       if len(self._input_stream_type_info.keys()) != 1:
         raise ValueError(
             "Can't process single image input since the graph has more than one input streams."
         )
-      input_dict = {next(iter(self._input_stream_type_info)): input_data}
-    else:
-      input_dict = input_data
+      return {next(iter(self._input_stream_type_info)): input_data}
+    return input_data
+
+  def _next_timestamp(self, timestamp_us: Optional[int] = None) -> int:
+    """Validates and records the timestamp for the next input."""
+    if timestamp_us is None:
+      # Set the timestamp increment to 33333 us to simulate the 30 fps video
+      # input.
+      timestamp_us = self._timestamp_us + 33333
+    elif int(timestamp_us) <= self._timestamp_us:
+      raise ValueError(
+          f'Input timestamps must be monotonically increasing: got '
+          f'{timestamp_us} us after {self._timestamp_us} us.')
+    self._timestamp_us = int(timestamp_us)
+    return self._timestamp_us
 
-    # Set the timestamp increment to 33333 us to simulate the 30 fps video
-    # input.
-    self._simulated_timestamp += 33333
+  def _add_inputs(self, input_dict: Mapping[str, Any], timestamp: int) -> None:
+    """Adds one packet per input stream at the given graph timestamp."""
     for stream_name, data in input_dict.items():
       input_stream_type = self._input_stream_type_info[stream_name]
       if (input_stream_type == PacketDataType.PROTO_LIST or
@@ -325,32 +522,148 @@ class SolutionBase:
         self._graph.add_packet_to_input_stream(
             stream=stream_name,
             packet=self._make_packet(input_stream_type,
-                                     data).at(self._simulated_timestamp))
+                                     data).at(timestamp))
       else:
         self._graph.add_packet_to_input_stream(
             stream=stream_name,
             packet=self._make_packet(input_stream_type,
-                                     data).at(self._simulated_timestamp))
+                                     data).at(timestamp))
 
-    self._graph.wait_until_idle()
-    # Create a NamedTuple object where the field names are mapping to the graph
-    # output stream names.
-    solution_outputs = collections.namedtuple(
-        'SolutionOutputs', self._output_stream_type_info.keys())
-    for stream_name in self._output_stream_type_info.keys():
-      if stream_name in self._graph_outputs:
-        setattr(
-            solution_outputs, stream_name,
-            self._get_packet_content(self._output_stream_type_info[stream_name],
-                                     self._graph_outputs[stream_name]))
+  def _select_outputs(
+      self, outputs: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """Validates a per-call output selection."""
+    if outputs is None:
+      return None
+    selected = frozenset(outputs)
+    unknown = selected.difference(self._output_stream_type_info)
+    if unknown:
+      raise ValueError(
+          f'Unknown output stream names: {sorted(unknown)}. The graph outputs '
+          f'are {list(self._output_stream_type_info)}.')
+    return selected
+
+  def _make_outputs(
+      self,
+      graph_outputs: Mapping[str, packet.Packet],
+      selected: Optional[FrozenSet[str]] = None) -> SolutionOutputs:
+    # Wrap a copy of the output packets in a new instance of the result type
+    # built in __init__; its fields decode the packets on first access.
+    if selected is None:
+      return self._outputs_type(dict(graph_outputs))
+    return self._outputs_type({
+        stream_name: output_packet
+        for stream_name, output_packet in graph_outputs.items()
+        if stream_name in selected
+    })
+
+  def _on_output(self, stream_name: str, output_packet: packet.Packet) -> None:
+    """Output stream callback, run on a graph thread."""
+    timestamp = output_packet.timestamp.value
+    with self._async_cond:
+      if not self._pending:
+        self._graph_outputs[stream_name] = output_packet
+        return
+      if not output_packet.is_empty():
+        for frame in self._pending:
+          if frame.timestamp == timestamp:
+            frame.packets[stream_name] = output_packet
+            break
+      if timestamp > self._stream_progress.get(stream_name, -1):
+        self._stream_progress[stream_name] = timestamp
+      # A stream that reported timestamp t will not produce anything at or
+      # before t anymore, so every pending frame up to the slowest stream is
+      # complete.
+      settled = min(
+          self._stream_progress.get(name, -1)
+          for name in self._output_stream_type_info)
+      done = []
+      while self._pending and self._pending[0].timestamp <= settled:
+        done.append(self._pending.popleft())
+      self._record_latency(done)
+    self._settle(done)
+
+  def _record_latency(self, done: List[_PendingFrame]) -> None:
+    """Folds the submit-to-settle latency of frames into the running average."""
+    now = time.monotonic()
+    for frame in done:
+      latency = now - frame.submitted
+      if self._settle_latency_s == 0.0:
+        self._settle_latency_s = latency
       else:
-        setattr(solution_outputs, stream_name, None)
+        self._settle_latency_s += ASYNC_LATENCY_SMOOTHING * (
+            latency - self._settle_latency_s)
+
+  def _settle(self, done: List[_PendingFrame]) -> None:
+    """Completes the futures of frames already taken off the pending queue."""
+    for frame in done:
+      if not frame.future.cancelled():
+        frame.future.set_result(
+            self._make_outputs(frame.packets, frame.outputs))
+    if done:
+      with self._async_cond:
+        self._async_cond.notify_all()
+
+  def _wait_for(self,
+                frame: _PendingFrame,
+                timeout: Optional[float] = None) -> bool:
+    """Blocks until a pending frame is complete.
 
-    return solution_outputs
+    Args:
+      frame: The pending frame to wait for.
+      timeout: The maximum number of seconds to wait, or None to wait until the
+        frame is complete.
+
+    Returns:
+      Whether the frame is complete.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with self._async_cond:
+      while not frame.future.done():
+        now = time.monotonic()
+        stall = frame.submitted + max(
+            ASYNC_SETTLE_TIMEOUT_S,
+            ASYNC_STALL_FACTOR * self._settle_latency_s) - now
+        if deadline is not None and deadline - now < stall:
+          if deadline <= now:
+            return False
+          self._async_cond.wait(deadline - now)
+        elif stall > 0:
+          self._async_cond.wait(stall)
+        else:
+          break
+      else:
+        return True
+    # Some graphs don't propagate timestamp bounds to every output; once the
+    # graph is idle nothing more can arrive for any pending frame.
+    self._graph.wait_until_idle()
+    self._complete_pending()
+    return True
+
+  def _wait_for_pending(self) -> None:
+    with self._async_cond:
+      newest = self._pending[-1] if self._pending else None
+    if newest is not None:
+      self._wait_for(newest)
+
+  def _pending_frame(self, future: futures.Future) -> Optional[_PendingFrame]:
+    with self._async_cond:
+      for frame in self._pending:
+        if frame.future is future:
+          return frame
+    return None
+
+  def _complete_pending(self) -> None:
+    """Completes every pending frame with whatever outputs it has received."""
+    with self._async_cond:
+      done = list(self._pending)
+      self._pending.clear()
+      self._record_latency(done)
+    self._settle(done)
 
   def close(self) -> None:
     """Closes all the input sources and the graph."""
     self._graph.close()
+    self._complete_pending()
     self._graph = None
     self._input_stream_type_info = None
     self._output_stream_type_info = None
@@ -359,6 +672,8 @@ class SolutionBase:
     """Resets the graph for another run."""
     if self._graph:
       self._graph.close()
+      self._complete_pending()
+      self._stream_progress.clear()
       self._graph.start_run(self._input_side_packets)
 
   def _initialize_graph_interface(
@@ -593,3 +908,38 @@ class SolutionBase:
   def __exit__(self, exc_type, exc_val, exc_tb):
     """Closes all the input sources and the graph."""
     self.close()
+
+
+class _SolutionFuture(futures.Future):
+  """A process_async() result that drives the graph when waited on."""
+
+  def __init__(self, solution: SolutionBase):
+    super().__init__()
+    self._solution = solution
+
+  def result(self, timeout: Optional[float] = None) -> Any:
+    """Waits up to timeout seconds for the outputs.
+
+    Results are normally completed by the graph's output callbacks. Only a
+    stalled graph is driven to idle from here, and only while the timeout
+    allows it.
+
+    Args:
+      timeout: The maximum number of seconds to wait, or None to wait as long
+        as it takes.
+
+    Raises:
+      concurrent.futures.TimeoutError: If the result didn't complete in time.
+
+    Returns:
+      The SolutionOutputs of the process_async() call.
+    """
+    # pylint: disable=protected-access
+    deadline = None if timeout is None else time.monotonic() + timeout
+    frame = self._solution._pending_frame(self)
+    if frame is not None and not self._solution._wait_for(frame, timeout):
+      raise futures.TimeoutError()
+    # pylint: enable=protected-access
+    if deadline is not None:
+      timeout = max(deadline - time.monotonic(), 0.0)
+    return super().result(timeout)
@@ -14,6 +14,8 @@
 
 """Tests for mediapipe.python.solution_base."""
 
+import threading
+
 from absl.testing import absltest
 from absl.testing import parameterized
 import numpy as np
@@ -377,6 +379,140 @@ class SolutionBaseTest(parameterized.TestCase):
         outputs = solution2.process(input_image)
         self.assertTrue(np.array_equal(input_image, outputs.image_type_out))
 
+  def test_solution_outputs_type_is_reused(self):
+    text_config = """
+      input_stream: 'image_in'
+      output_stream: 'image_out'
+      node {
+        calculator: 'ImageTransformationCalculator'
+        input_stream: 'IMAGE:image_in'
+        output_stream: 'IMAGE:image_out'
+      }
+    """
+    config_proto = text_format.Parse(text_config,
+                                     calculator_pb2.CalculatorGraphConfig())
+    image_0 = np.zeros((3, 3, 3), dtype=np.uint8)
+    image_1 = np.ones((3, 3, 3), dtype=np.uint8)
+    with solution_base.SolutionBase(graph_config=config_proto) as solution:
+      outputs_0 = solution.process(image_0)
+      outputs_1 = solution.process(image_1)
+    self.assertIs(type(outputs_0), type(outputs_1))
+    self.assertIsInstance(outputs_0, solution_base.SolutionOutputs)
+    self.assertEqual(outputs_0._fields, ('image_out',))
+    self.assertTrue(np.array_equal(image_0, outputs_0.image_out))
+    self.assertTrue(np.array_equal(image_1, outputs_1.image_out))
+    with self.assertRaises(AttributeError):
+      outputs_0.unknown_stream = None
+
+  def test_solution_process_with_timestamps(self):
+    text_config = """
+      input_stream: 'image_in'
+      output_stream: 'image_out'
+      node {
+        calculator: 'ImageTransformationCalculator'
+        input_stream: 'IMAGE:image_in'
+        output_stream: 'IMAGE:image_out'
+      }
+    """
+    config_proto = text_format.Parse(text_config,
+                                     calculator_pb2.CalculatorGraphConfig())
+    input_image = np.arange(27, dtype=np.uint8).reshape(3, 3, 3)
+    with solution_base.SolutionBase(graph_config=config_proto) as solution:
+      # Variable frame intervals, e.g. 60 fps with a dropped frame.
+      for timestamp_us in (1000, 17666, 34333, 67666):
+        outputs = solution.process(input_image, timestamp_us=timestamp_us)
+        self.assertTrue(np.array_equal(input_image, outputs.image_out))
+      outputs = solution.process(input_image)
+      self.assertTrue(np.array_equal(input_image, outputs.image_out))
+      with self.assertRaisesRegex(ValueError, 'monotonically increasing'):
+        solution.process(input_image, timestamp_us=67666 + 33333)
+      with self.assertRaisesRegex(ValueError, 'monotonically increasing'):
+        solution.process_async(input_image, timestamp_us=1000)
+      outputs = solution.process_async(
+          input_image, timestamp_us=200000).result()
+      self.assertTrue(np.array_equal(input_image, outputs.image_out))
+
+  @parameterized.named_parameters(('depth_1', 1), ('depth_2', 2),
+                                  ('depth_4', 4))
+  def test_solution_process_async(self, max_in_flight):
+    text_config = """
+      input_stream: 'image_in'
+      output_stream: 'image_out'
+      node {
+        calculator: 'ImageTransformationCalculator'
+        input_stream: 'IMAGE:image_in'
+        output_stream: 'IMAGE:image_out'
+      }
+    """
+    config_proto = text_format.Parse(text_config,
+                                     calculator_pb2.CalculatorGraphConfig())
+    input_images = [
+        np.full((3, 3, 3), i, dtype=np.uint8) for i in range(10)
+    ]
+    with solution_base.SolutionBase(
+        graph_config=config_proto, max_in_flight=max_in_flight) as solution:
+      results = [solution.process_async(image) for image in input_images]
+      for input_image, result in zip(input_images, results):
+        self.assertTrue(
+            np.array_equal(input_image, result.result().image_out))
+      pending = solution.process_async(input_images[0])
+      outputs = solution.process(input_images[1])
+      self.assertTrue(pending.done())
+      self.assertTrue(
+          np.array_equal(input_images[0], pending.result().image_out))
+      self.assertTrue(np.array_equal(input_images[1], outputs.image_out))
+      # Output callbacks complete the future without anyone waiting on it.
+      done = threading.Event()
+      pending = solution.process_async(input_images[2])
+      pending.add_done_callback(lambda _: done.set())
+      self.assertTrue(done.wait(5))
+      self.assertTrue(
+          np.array_equal(input_images[2],
+                         pending.result(timeout=0).image_out))
+
+  def test_solution_process_selected_outputs(self):
+    text_config = """
+      input_stream: 'image_in'
+      output_stream: 'image_out'
+      output_stream: 'flipped_image_out'
+      node {
+        calculator: 'ImageTransformationCalculator'
+        input_stream: 'IMAGE:image_in'
+        output_stream: 'IMAGE:image_out'
+      }
+      node {
+        calculator: 'ImageTransformationCalculator'
+        input_stream: 'IMAGE:image_in'
+        output_stream: 'IMAGE:flipped_image_out'
+        options {
+          [mediapipe.ImageTransformationCalculatorOptions.ext] {
+            flip_horizontally: true
+          }
+        }
+      }
+    """
+    config_proto = text_format.Parse(text_config,
+                                     calculator_pb2.CalculatorGraphConfig())
+    input_image = np.arange(27, dtype=np.uint8).reshape(3, 3, 3)
+    with solution_base.SolutionBase(graph_config=config_proto) as solution:
+      outputs = solution.process(input_image)
+      selected = solution.process(input_image, outputs=['image_out'])
+      pending = solution.process_async(
+          input_image, outputs=['flipped_image_out'])
+      with self.assertRaisesRegex(ValueError, 'Unknown output stream names'):
+        solution.process(input_image, outputs=['image_outs'])
+      selected_async = pending.result()
+    self.assertEqual(outputs._fields, ('image_out', 'flipped_image_out'))
+    self.assertTrue(np.array_equal(input_image, outputs.image_out))
+    self.assertTrue(
+        np.array_equal(input_image[:, ::-1], outputs.flipped_image_out))
+    self.assertIs(outputs.image_out, outputs.image_out)
+    self.assertTrue(np.array_equal(input_image, selected.image_out))
+    self.assertIsNone(selected.flipped_image_out)
+    self.assertIsNone(selected_async.image_out)
+    self.assertTrue(
+        np.array_equal(input_image[:, ::-1], selected_async.flipped_image_out))
+
   def _process_and_verify(self,
                           config_proto,
                           side_inputs=None,
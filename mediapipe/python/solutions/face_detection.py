@@ -14,13 +14,14 @@
 """MediaPipe Face Detection."""
 
 import enum
-from typing import NamedTuple, Union
+from typing import Union
 
 import numpy as np
 from mediapipe.framework.formats import detection_pb2
 from mediapipe.framework.formats import location_data_pb2
 from mediapipe.modules.face_detection import face_detection_pb2
 from mediapipe.python.solution_base import SolutionBase
+from mediapipe.python.solution_base import SolutionOutputs
 
 _SHORT_RANGE_GRAPH_FILE_PATH = 'mediapipe/modules/face_detection/face_detection_short_range_cpu.binarypb'
 _FULL_RANGE_GRAPH_FILE_PATH = 'mediapipe/modules/face_detection/face_detection_full_range_cpu.binarypb'
@@ -87,7 +88,7 @@ class FaceDetection(SolutionBase):
             }),
         outputs=['detections'])
 
-  def process(self, image: np.ndarray) -> NamedTuple:
+  def process(self, image: np.ndarray) -> SolutionOutputs:
     """Processes an RGB image and returns a list of the detected face location data.
 
     Args:
@@ -98,8 +99,8 @@ class FaceDetection(SolutionBase):
       ValueError: If the input image is not three channel RGB.
 
     Returns:
-      A NamedTuple object with a "detections" field that contains a list of the
-      detected face location data.
+      A SolutionOutputs object with a "detections" field that contains a list of
+      the detected face location data.
     """
 
     return super().process(input_data={'image': image})
@@ -14,7 +14,6 @@
 
 """MediaPipe Face Mesh."""
 
-from typing import NamedTuple
 
 import numpy as np
 
@@ -37,6 +36,7 @@ from mediapipe.calculators.util import rect_transformation_calculator_pb2
 from mediapipe.calculators.util import thresholding_calculator_pb2
 # pylint: enable=unused-import
 from mediapipe.python.solution_base import SolutionBase
+from mediapipe.python.solution_base import SolutionOutputs
 # pylint: disable=unused-import
 from mediapipe.python.solutions.face_mesh_connections import FACEMESH_CONTOURS
 from mediapipe.python.solutions.face_mesh_connections import FACEMESH_FACE_OVAL
@@ -107,7 +107,7 @@ class FaceMesh(SolutionBase):
         },
         outputs=['multi_face_landmarks'])
 
-  def process(self, image: np.ndarray) -> NamedTuple:
+  def process(self, image: np.ndarray) -> SolutionOutputs:
     """Processes an RGB image and returns the face landmarks on each detected face.
 
     Args:
@@ -118,8 +118,8 @@ class FaceMesh(SolutionBase):
       ValueError: If the input image is not three channel RGB.
 
     Returns:
-      A NamedTuple object with a "multi_face_landmarks" field that contains the
-      face landmarks on each detected face.
+      A SolutionOutputs object with a "multi_face_landmarks" field that contains
+      the face landmarks on each detected face.
     """
 
     return super().process(input_data={'image': image})
@@ -15,7 +15,7 @@
 """MediaPipe Hands."""
 
 import enum
-from typing import NamedTuple
+from typing import Iterable, Optional
 
 import numpy as np
 
@@ -36,7 +36,9 @@ from mediapipe.calculators.util import non_max_suppression_calculator_pb2
 from mediapipe.calculators.util import rect_transformation_calculator_pb2
 from mediapipe.calculators.util import thresholding_calculator_pb2
 # pylint: enable=unused-import
+from mediapipe.python.solution_base import PacketDataType
 from mediapipe.python.solution_base import SolutionBase
+from mediapipe.python.solution_base import SolutionOutputs
 # pylint: disable=unused-import
 from mediapipe.python.solutions.hands_connections import HAND_CONNECTIONS
 # pylint: enable=unused-import
@@ -91,7 +93,8 @@ class Hands(SolutionBase):
                max_num_hands=2,
                model_complexity=1,
                min_detection_confidence=0.5,
-               min_tracking_confidence=0.5):
+               min_tracking_confidence=0.5,
+               landmark_arrays=False):
     """Initializes a MediaPipe Hand object.
 
     Args:
@@ -110,6 +113,10 @@ class Hands(SolutionBase):
       min_tracking_confidence: Minimum confidence value ([0.0, 1.0]) for the
         hand landmarks to be considered tracked successfully. See details in
         https://solutions.mediapipe.dev/hands#min_tracking_confidence.
+      landmark_arrays: Whether to return the hand landmarks and world landmarks
+        as float32 numpy arrays of shape (num_hands, 21, 3) instead of lists of
+        landmark list protos. The arrays are read straight from the serialized
+        packets without building proto objects.
     """
     super().__init__(
         binary_graph_path=_BINARYPB_FILE_PATH,
@@ -127,20 +134,34 @@ class Hands(SolutionBase):
         outputs=[
             'multi_hand_landmarks', 'multi_hand_world_landmarks',
             'multi_handedness'
-        ])
-
-  def process(self, image: np.ndarray) -> NamedTuple:
+        ],
+        stream_type_hints={
+            'multi_hand_landmarks': PacketDataType.LANDMARK_LIST_ARRAY,
+            'multi_hand_world_landmarks': PacketDataType.LANDMARK_LIST_ARRAY,
+        } if landmark_arrays else None)
+
+  def process(self,
+              image: np.ndarray,
+              timestamp_us: Optional[int] = None,
+              outputs: Optional[Iterable[str]] = None) -> SolutionOutputs:
     """Processes an RGB image and returns the hand landmarks and handedness of each detected hand.
 
     Args:
       image: An RGB image represented as a numpy ndarray.
+      timestamp_us: The monotonic capture time of the image in microseconds. If
+        None, frames are assumed to arrive at 30 fps.
+      outputs: The fields below that the caller is going to read, e.g.
+        ['multi_hand_landmarks', 'multi_handedness'] to skip decoding the world
+        landmarks. The other fields are None. If None, all fields are set.
 
     Raises:
       RuntimeError: If the underlying graph throws any error.
-      ValueError: If the input image is not three channel RGB.
+      ValueError: If the input image is not three channel RGB, if timestamp_us
+        is not greater than the previous one, or if outputs names an unknown
+        field.
 
     Returns:
-      A NamedTuple object with the following fields:
+      A SolutionOutputs object whose fields are decoded on first access:
         1) a "multi_hand_landmarks" field that contains the hand landmarks on
            each detected hand.
         2) a "multi_hand_world_landmarks" field that contains the hand landmarks
@@ -148,6 +169,11 @@ class Hands(SolutionBase):
            with the origin at the hand's approximate geometric center.
         3) a "multi_handedness" field that contains the handedness (left v.s.
            right hand) of the detected hand.
+      With landmark_arrays, the two landmark fields are (num_hands, 21, 3)
+      numpy arrays.
     """
 
-    return super().process(input_data={'image': image})
+    return super().process(
+        input_data={'image': image},
+        timestamp_us=timestamp_us,
+        outputs=outputs)
@@ -128,6 +128,30 @@ class HandsTest(parameterized.TestCase):
         diff_threshold = LITE_MODEL_DIFF_THRESHOLD if model_complexity == 0 else FULL_MODEL_DIFF_THRESHOLD
         npt.assert_array_less(prediction_error, diff_threshold)
 
+  def test_landmark_arrays(self):
+    image_path = os.path.join(os.path.dirname(__file__), 'testdata/hands.jpg')
+    image = cv2.cvtColor(cv2.imread(image_path), cv2.COLOR_BGR2RGB)
+    with mp_hands.Hands(static_image_mode=True, max_num_hands=2) as hands:
+      results = hands.process(image)
+    with mp_hands.Hands(
+        static_image_mode=True, max_num_hands=2,
+        landmark_arrays=True) as hands:
+      array_results = hands.process(image)
+    self.assertEqual(array_results.multi_hand_landmarks.shape, (2, 21, 3))
+    self.assertEqual(array_results.multi_hand_landmarks.dtype, np.float32)
+    self.assertEqual(array_results.multi_hand_world_landmarks.shape,
+                     (2, 21, 3))
+    npt.assert_allclose(
+        array_results.multi_hand_landmarks,
+        [self._world_landmarks_list_to_array(landmarks)
+         for landmarks in results.multi_hand_landmarks],
+        rtol=1e-6)
+    npt.assert_allclose(
+        array_results.multi_hand_world_landmarks,
+        [self._world_landmarks_list_to_array(landmarks)
+         for landmarks in results.multi_hand_world_landmarks],
+        rtol=1e-6)
+
   def _process_video(self, model_complexity, video_path,
                      max_num_hands=1,
                      num_landmarks=21,
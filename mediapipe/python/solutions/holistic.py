@@ -13,7 +13,6 @@
 # limitations under the License.
 """MediaPipe Holistic."""
 
-from typing import NamedTuple
 
 import numpy as np
 
@@ -39,6 +38,7 @@ from mediapipe.modules.holistic_landmark.calculators import roi_tracking_calcula
 # pylint: enable=unused-import
 
 from mediapipe.python.solution_base import SolutionBase
+from mediapipe.python.solution_base import SolutionOutputs
 from mediapipe.python.solutions import download_utils
 # pylint: disable=unused-import
 from mediapipe.python.solutions.face_mesh_connections import FACEMESH_CONTOURS
@@ -133,7 +133,7 @@ class Holistic(SolutionBase):
             'right_hand_landmarks', 'face_landmarks', 'segmentation_mask'
         ])
 
-  def process(self, image: np.ndarray) -> NamedTuple:
+  def process(self, image: np.ndarray) -> SolutionOutputs:
     """Processes an RGB image and returns the pose landmarks, left and right hand landmarks, and face landmarks on the most prominent person detected.
 
     Args:
@@ -144,8 +144,8 @@ class Holistic(SolutionBase):
       ValueError: If the input image is not three channel RGB.
 
     Returns:
-      A NamedTuple with fields describing the landmarks on the most prominate
-      person detected:
+      A SolutionOutputs object with fields describing the landmarks on the most
+      prominate person detected:
         1) "pose_landmarks" field that contains the pose landmarks.
         2) "pose_world_landmarks" field that contains the pose landmarks in
         real-world 3D coordinates that are in meters with the origin at the
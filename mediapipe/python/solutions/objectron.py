@@ -15,7 +15,7 @@
 """MediaPipe Objectron."""
 
 import enum
-from typing import List, Tuple, NamedTuple, Optional
+from typing import List, Tuple, Optional
 
 import attr
 import numpy as np
@@ -45,6 +45,7 @@ from mediapipe.modules.objectron.calculators import frame_annotation_to_rect_cal
 from mediapipe.modules.objectron.calculators import lift_2d_frame_annotation_to_3d_calculator_pb2
 # pylint: enable=unused-import
 from mediapipe.python.solution_base import SolutionBase
+from mediapipe.python.solution_base import SolutionOutputs
 from mediapipe.python.solutions import download_utils
 
 
@@ -241,7 +242,7 @@ class Objectron(SolutionBase):
         },
         outputs=['detected_objects'])
 
-  def process(self, image: np.ndarray) -> NamedTuple:
+  def process(self, image: np.ndarray) -> SolutionOutputs:
     """Processes an RGB image and returns the box landmarks and rectangular bounding box of each detected object.
 
     Args:
@@ -252,8 +253,8 @@ class Objectron(SolutionBase):
       ValueError: If the input image is not three channel RGB.
 
     Returns:
-      A NamedTuple object with a "detected_objects" field that contains a list
-      of detected 3D bounding boxes. Each detected box is represented as an
+      A SolutionOutputs object with a "detected_objects" field that contains a
+      list of detected 3D bounding boxes. Each detected box is represented as an
       "ObjectronOutputs" instance.
     """
 
@@ -15,7 +15,6 @@
 """MediaPipe Pose."""
 
 import enum
-from typing import NamedTuple
 
 import numpy as np
 
@@ -44,6 +43,7 @@ from mediapipe.calculators.util import visibility_smoothing_calculator_pb2
 from mediapipe.framework.tool import switch_container_pb2
 # pylint: enable=unused-import
 from mediapipe.python.solution_base import SolutionBase
+from mediapipe.python.solution_base import SolutionOutputs
 from mediapipe.python.solutions import download_utils
 # pylint: disable=unused-import
 from mediapipe.python.solutions.pose_connections import POSE_CONNECTIONS
@@ -161,7 +161,7 @@ class Pose(SolutionBase):
         },
         outputs=['pose_landmarks', 'pose_world_landmarks', 'segmentation_mask'])
 
-  def process(self, image: np.ndarray) -> NamedTuple:
+  def process(self, image: np.ndarray) -> SolutionOutputs:
     """Processes an RGB image and returns the pose landmarks on the most prominent person detected.
 
     Args:
@@ -172,8 +172,8 @@ class Pose(SolutionBase):
       ValueError: If the input image is not three channel RGB.
 
     Returns:
-      A NamedTuple with fields describing the landmarks on the most prominate
-      person detected:
+      A SolutionOutputs object with fields describing the landmarks on the most
+      prominate person detected:
         1) "pose_landmarks" field that contains the pose landmarks.
         2) "pose_world_landmarks" field that contains the pose landmarks in
         real-world 3D coordinates that are in meters with the origin at the
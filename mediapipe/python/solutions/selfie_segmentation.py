@@ -13,7 +13,6 @@
 # limitations under the License.
 """MediaPipe Selfie Segmentation."""
 
-from typing import NamedTuple
 
 import numpy as np
 # The following imports are needed because python pb2 silently discards
@@ -28,6 +27,7 @@ from mediapipe.framework.tool import switch_container_pb2
 # pylint: enable=unused-import
 
 from mediapipe.python.solution_base import SolutionBase
+from mediapipe.python.solution_base import SolutionOutputs
 
 _BINARYPB_FILE_PATH = 'mediapipe/modules/selfie_segmentation/selfie_segmentation_cpu.binarypb'
 
@@ -58,7 +58,7 @@ class SelfieSegmentation(SolutionBase):
         },
         outputs=['segmentation_mask'])
 
-  def process(self, image: np.ndarray) -> NamedTuple:
+  def process(self, image: np.ndarray) -> SolutionOutputs:
     """Processes an RGB image and returns a segmentation mask.
 
     Args:
@@ -69,8 +69,8 @@ class SelfieSegmentation(SolutionBase):
       ValueError: If the input image is not three channel RGB.
 
     Returns:
-      A NamedTuple object with a "segmentation_mask" field that contains a float
-      type 2d np array representing the mask.
+      A SolutionOutputs object with a "segmentation_mask" field that contains a
+      float type 2d np array representing the mask.
     """
 
     return super().process(input_data={'image': image})
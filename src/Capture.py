@@ -0,0 +1,123 @@
+import logging
+import threading
+import cv2
+import numpy as np
+from typing import Optional
+
+INITIAL_BACKOFF = 0.05
+MAX_BACKOFF = 2.0
+REOPEN_AFTER_FAILURES = 5
+
+
+class CameraSource:
+    """Event-driven wrapper around cv2.VideoCapture.
+
+    read() blocks on the device (grab + retrieve) while frames flow. When the
+    source is stopped it sleeps on a condition variable instead of spinning, and
+    read failures back off exponentially before the device is reopened.
+    release() never closes the device under a running read: it is deferred to
+    the reading thread, which closes it as soon as the read returns.
+    """
+
+    lossless = False
+
+    def __init__(self, width: int, height: int, max_backoff: float = MAX_BACKOFF,
+                 reopen_after: int = REOPEN_AFTER_FAILURES) -> None:
+        self.width = width
+        self.height = height
+        self.max_backoff = max_backoff
+        self.reopen_after = reopen_after
+        self.index: Optional[int] = None
+        self.cap: Optional[cv2.VideoCapture] = None
+        self.failures: int = 0
+        self.reopens: int = 0
+        self._backoff = INITIAL_BACKOFF
+        self._active = False
+        self._reading = False
+        self._release_pending = False
+        self._cond = threading.Condition()
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def start(self, index: int) -> None:
+        with self._cond:
+            if index != self.index:
+                self._release()
+            self.index = index
+            self._active = True
+            self._backoff = INITIAL_BACKOFF
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        """Deactivate the source and wake up any reader waiting on it."""
+        with self._cond:
+            self._active = False
+            self._cond.notify_all()
+
+    def release(self) -> None:
+        with self._cond:
+            self._release()
+
+    def _release(self) -> None:
+        """Close the device now, or after the read in progress; call with the lock held."""
+        if self._reading:
+            self._release_pending = True
+            return
+        self._release_pending = False
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    def _open(self) -> bool:
+        cap = cv2.VideoCapture(self.index)
+        if not cap.isOpened():
+            cap.release()
+            return False
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.cap = cap
+        return True
+
+    def _fail(self) -> None:
+        """Record a failed read and sleep for the current backoff, waking early on stop."""
+        with self._cond:
+            self.failures += 1
+            if self.failures % self.reopen_after == 0 and self.cap is not None:
+                logging.warning(f"Camera {self.index} stopped delivering frames, reopening.")
+                self._release()
+                self.reopens += 1
+            if self._active:
+                self._cond.wait(self._backoff)
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+
+    def _grab(self) -> Optional[np.ndarray]:
+        if self.cap is None and not self._open():
+            return None
+        if not self.cap.grab():
+            return None
+        success, frame = self.cap.retrieve()
+        return frame if success else None
+
+    def read(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Return the next frame, or None if the source is stopped or the read failed."""
+        with self._cond:
+            if not self._active:
+                self._cond.wait(timeout)
+                if not self._active:
+                    return None
+            self._reading = True
+        try:
+            frame = self._grab()
+        finally:
+            with self._cond:
+                self._reading = False
+                if self._release_pending:
+                    self._release()
+        if frame is None:
+            self._fail()
+            return None
+        self.failures = 0
+        self._backoff = INITIAL_BACKOFF
+        return frame
@@ -0,0 +1,221 @@
+import abc
+import csv
+import sys
+import argparse
+import numpy as np
+from typing import Dict, Optional, Tuple
+from Smoothing import OneEuroFilter
+
+MAX_LAG_FRAMES = 30
+
+
+class CursorFilter(abc.ABC):
+    """Base class for cursor filters mapping noisy targets to smoothed positions.
+
+    lookahead extrapolates the filtered position along the estimated velocity
+    by that many seconds, compensating for pipeline latency.
+    """
+
+    def __init__(self, lookahead: float = 0.0) -> None:
+        self.lookahead = lookahead
+
+    @abc.abstractmethod
+    def reset(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def update(self, x: float, y: float, t: float) -> Tuple[float, float, float, float]:
+        """Return the filtered position and velocity (x, y, vx, vy)."""
+
+    def __call__(self, x: float, y: float, t: float) -> Tuple[float, float]:
+        fx, fy, vx, vy = self.update(x, y, t)
+        if self.lookahead:
+            return fx + vx * self.lookahead, fy + vy * self.lookahead
+        return fx, fy
+
+
+class ExponentialCursorFilter(CursorFilter):
+    """The fixed-factor exponential blend the cursor has always used."""
+
+    def __init__(self, factor: float = 0.2, lookahead: float = 0.0) -> None:
+        super().__init__(lookahead)
+        self.factor = factor
+        self.reset()
+
+    def reset(self) -> None:
+        self._x: Optional[float] = None
+        self._y = 0.0
+        self._t = 0.0
+        self._vx = self._vy = 0.0
+
+    def update(self, x: float, y: float, t: float) -> Tuple[float, float, float, float]:
+        if self._x is None:
+            self._x, self._y, self._t = x, y, t
+            return x, y, 0.0, 0.0
+        nx = self._x + self.factor * (x - self._x)
+        ny = self._y + self.factor * (y - self._y)
+        dt = t - self._t
+        if dt > 0:
+            self._vx, self._vy = (nx - self._x) / dt, (ny - self._y) / dt
+        self._x, self._y, self._t = nx, ny, t
+        return nx, ny, self._vx, self._vy
+
+
+class OneEuroCursorFilter(CursorFilter):
+    """Velocity-adaptive One-Euro filter: low lag at speed, low jitter at rest."""
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.005, d_cutoff: float = 1.0,
+                 lookahead: float = 0.0) -> None:
+        super().__init__(lookahead)
+        self._filter = OneEuroFilter((2,), min_cutoff, beta, d_cutoff, dtype=np.float64)
+        self._point = np.zeros(2, dtype=np.float64)
+
+    def reset(self) -> None:
+        self._filter.reset()
+
+    def update(self, x: float, y: float, t: float) -> Tuple[float, float, float, float]:
+        self._point[0], self._point[1] = x, y
+        fx, fy = self._filter(self._point, t)
+        vx, vy = self._filter.velocity
+        return float(fx), float(fy), float(vx), float(vy)
+
+
+class KalmanCursorFilter(CursorFilter):
+    """Constant-velocity Kalman filter on each axis.
+
+    Both axes share the same noise model and timing, so they also share one
+    2x2 covariance matrix. process_noise is the acceleration noise density in
+    px/s^2 and measurement_noise the target noise in px.
+    """
+
+    def __init__(self, process_noise: float = 3000.0, measurement_noise: float = 4.0,
+                 lookahead: float = 0.0) -> None:
+        super().__init__(lookahead)
+        self.q = process_noise ** 2
+        self.r = measurement_noise ** 2
+        self.reset()
+
+    def reset(self) -> None:
+        self._state: Optional[np.ndarray] = None
+        self._cov = np.eye(2) * self.r
+        self._t = 0.0
+
+    def update(self, x: float, y: float, t: float) -> Tuple[float, float, float, float]:
+        if self._state is None:
+            self._state = np.array([[x, 0.0], [y, 0.0]])
+            self._cov = np.diag([self.r, self.r * 100.0])
+            self._t = t
+            return x, y, 0.0, 0.0
+        dt = max(t - self._t, 1e-6)
+        self._t = t
+
+        # Predict: p += v*dt, with white-noise acceleration.
+        self._state[:, 0] += self._state[:, 1] * dt
+        p00, p01, p11 = self._cov[0, 0], self._cov[0, 1], self._cov[1, 1]
+        p00 = p00 + dt * (2 * p01 + dt * p11) + self.q * dt ** 4 / 4
+        p01 = p01 + dt * p11 + self.q * dt ** 3 / 2
+        p11 = p11 + self.q * dt ** 2
+
+        # Update with the measured position.
+        s = p00 + self.r
+        k0, k1 = p00 / s, p01 / s
+        residual = np.array([x, y]) - self._state[:, 0]
+        self._state[:, 0] += k0 * residual
+        self._state[:, 1] += k1 * residual
+        self._cov[0, 0] = (1 - k0) * p00
+        self._cov[0, 1] = self._cov[1, 0] = (1 - k0) * p01
+        self._cov[1, 1] = p11 - k1 * p01
+        (fx, vx), (fy, vy) = self._state
+        return float(fx), float(fy), float(vx), float(vy)
+
+
+CURSOR_FILTERS = {
+    'exponential': ExponentialCursorFilter,
+    'one_euro': OneEuroCursorFilter,
+    'kalman': KalmanCursorFilter,
+}
+
+
+def make_cursor_filter(name: str, **params) -> CursorFilter:
+    try:
+        return CURSOR_FILTERS[name](**params)
+    except KeyError:
+        raise ValueError(f"Unknown cursor filter: {name}")
+
+
+def is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def load_trace(path: str) -> np.ndarray:
+    """Load a recorded cursor trace as a (T, 3) array of [t, x, y] rows.
+
+    Accepts a CSV file with t, x, y columns (seconds, pixels) or a .npy array.
+    """
+    if path.endswith('.npy'):
+        return np.load(path).astype(np.float64)
+    with open(path, newline='') as f:
+        rows = [row for row in csv.reader(f) if row]
+    if rows and not is_number(rows[0][0]):
+        rows = rows[1:]
+    return np.array([[float(v) for v in row[:3]] for row in rows], dtype=np.float64)
+
+
+def replay(cursor_filter: CursorFilter, trace: np.ndarray) -> Dict[str, float]:
+    """Run a filter over a [t, x, y] trace and report jitter and lag.
+
+    jitter_px is the RMS frame-to-frame acceleration of the output (lower is
+    steadier); lag_ms is the time shift that best aligns the output with the raw
+    trace, and error_px the mean distance to the raw trace at that shift.
+    """
+    if len(trace) < 2:
+        raise ValueError(f"A trace needs at least 2 samples to replay, got {len(trace)}")
+    cursor_filter.reset()
+    out = np.array([cursor_filter(x, y, t) for t, x, y in trace])
+    raw = trace[:, 1:]
+
+    def rms_accel(points: np.ndarray) -> float:
+        if len(points) < 3:
+            return 0.0
+        return float(np.sqrt((np.diff(points, n=2, axis=0) ** 2).sum(axis=1).mean()))
+
+    best_shift, best_err = 0, float('inf')
+    max_shift = min(MAX_LAG_FRAMES, len(out) - 1)
+    for shift in range(-max_shift, max_shift + 1):
+        if shift >= 0:
+            err = np.linalg.norm(out[shift:] - raw[:len(raw) - shift], axis=1).mean()
+        else:
+            err = np.linalg.norm(out[:shift] - raw[-shift:], axis=1).mean()
+        if err < best_err:
+            best_shift, best_err = shift, err
+    frame_time = float(np.median(np.diff(trace[:, 0])))
+    return {
+        'jitter_px': round(rms_accel(out), 3),
+        'raw_jitter_px': round(rms_accel(raw), 3),
+        'lag_ms': round(best_shift * frame_time * 1000.0, 1),
+        'error_px': round(float(best_err), 2),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description='Replay a cursor trace through the cursor filters.')
+    parser.add_argument('trace', help='CSV (t,x,y), .npy or session recording (landmarks) trace file')
+    parser.add_argument('--filter', choices=sorted(CURSOR_FILTERS), action='append',
+                        help='filter to evaluate (default: all)')
+    parser.add_argument('--lookahead', type=float, default=0.0, help='prediction horizon in seconds')
+    args = parser.parse_args(argv)
+    import Recording
+    if Recording.is_session_recording(args.trace):
+        trace = Recording.landmark_trace(args.trace)
+    else:
+        trace = load_trace(args.trace)
+    for name in args.filter or sorted(CURSOR_FILTERS):
+        print(name, replay(make_cursor_filter(name, lookahead=args.lookahead), trace))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
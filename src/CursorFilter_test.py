@@ -0,0 +1,30 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from CursorFilter import load_trace, make_cursor_filter, replay
+
+
+class ReplayTest(unittest.TestCase):
+
+    def test_short_traces_are_rejected(self) -> None:
+        for trace in (np.zeros((0, 3)), np.array([[0.0, 10.0, 10.0]])):
+            with self.assertRaisesRegex(ValueError, 'at least 2 samples'):
+                replay(make_cursor_filter('one_euro'), trace)
+
+    def test_two_samples_replay(self) -> None:
+        trace = np.array([[0.0, 10.0, 10.0], [1 / 30, 12.0, 10.0]])
+        result = replay(make_cursor_filter('one_euro'), trace)
+        self.assertEqual(result['jitter_px'], 0.0)
+        self.assertTrue(np.isfinite(result['error_px']))
+
+    def test_csv_header_is_skipped(self) -> None:
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'w') as f:
+            f.write('t,x,y\n0,1,2\n0.5,3,4\n')
+        self.addCleanup(os.remove, path)
+        np.testing.assert_array_equal(load_trace(path), [[0, 1, 2], [0.5, 3, 4]])
+
+
+if __name__ == '__main__':
+    unittest.main()
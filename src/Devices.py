@@ -0,0 +1,265 @@
+import os
+import re
+import sys
+import abc
+import logging
+import threading
+from typing import Callable, Hashable, List, NamedTuple, Optional
+
+DISCOVERY_INTERVAL = 2.0
+V4L2_DEV_DIR = '/dev'
+V4L2_SYS_DIR = '/sys/class/video4linux'
+PROBE_MAX_INDEX = 4
+DEVICE_CLASSES_KEY = r'SYSTEM\CurrentControlSet\Control\DeviceClasses'
+# Device interface classes DirectShow video inputs are enumerated from.
+KS_VIDEO_CATEGORIES = (
+    '{65E8773D-8F56-11D0-A3B9-00A0C9223196}',  # KSCATEGORY_CAPTURE
+    '{E5323777-F976-4F5B-9B55-B94699C46E44}',  # KSCATEGORY_VIDEO_CAMERA
+)
+
+
+class Device(NamedTuple):
+    index: int
+    name: str
+
+
+class DeviceBackend(abc.ABC):
+    """Interface for listing capture devices.
+
+    open()/close() run on the discovery thread around all scans (for per-thread
+    setup such as COM). signature() should be a cheap check that changes when
+    devices come or go; list_devices() is only called again when it does. A
+    backend without a cheap check returns None and is rescanned every poll.
+    """
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def signature(self) -> Optional[Hashable]:
+        return None
+
+    @abc.abstractmethod
+    def list_devices(self) -> List[Device]:
+        """Enumerate the capture devices currently present."""
+
+
+class DShowDeviceBackend(DeviceBackend):
+    """DirectShow video input devices through pygrabber, indexed in enumeration order.
+
+    Enumerating through COM is slow, so the signature is read from the
+    registry instead: the kernel-streaming capture interfaces that are
+    currently linked (present). Plugging or unplugging a camera changes it.
+    Software-only DirectShow sources are not covered; refresh() picks them up.
+    """
+
+    def __init__(self) -> None:
+        import winreg
+        import pythoncom
+        from pygrabber.dshow_graph import FilterGraph
+        self._winreg = winreg
+        self._pythoncom = pythoncom
+        self._graph = FilterGraph
+
+    def open(self) -> None:
+        self._pythoncom.CoInitialize()
+
+    def close(self) -> None:
+        self._pythoncom.CoUninitialize()
+
+    def _linked(self, category: str) -> List[str]:
+        winreg = self._winreg
+        try:
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, f'{DEVICE_CLASSES_KEY}\\{category}')
+        except OSError:
+            return []
+        linked = []
+        with key:
+            index = 0
+            while True:
+                try:
+                    name = winreg.EnumKey(key, index)
+                except OSError:
+                    break
+                index += 1
+                try:
+                    with winreg.OpenKey(key, f'{name}\\#\\Control') as control:
+                        if winreg.QueryValueEx(control, 'Linked')[0]:
+                            linked.append(name)
+                except OSError:
+                    continue
+        return linked
+
+    def signature(self) -> Optional[Hashable]:
+        return frozenset(name for category in KS_VIDEO_CATEGORIES for name in self._linked(category))
+
+    def list_devices(self) -> List[Device]:
+        return [Device(i, name) for i, name in enumerate(self._graph().get_input_devices())]
+
+
+class V4L2DeviceBackend(DeviceBackend):
+    """/dev/videoN capture nodes, named from sysfs.
+
+    UVC cameras expose a metadata node next to each capture node; only nodes
+    with sysfs index 0 (the first node of a device) are listed. The signature
+    is the set of /dev/video* names, so a scan only happens on hotplug.
+    """
+
+    _NODE = re.compile(r'video(\d+)$')
+
+    def __init__(self, dev_dir: str = V4L2_DEV_DIR, sys_dir: str = V4L2_SYS_DIR) -> None:
+        self.dev_dir = dev_dir
+        self.sys_dir = sys_dir
+
+    def _nodes(self) -> List[int]:
+        try:
+            names = os.listdir(self.dev_dir)
+        except OSError:
+            return []
+        return sorted(int(m.group(1)) for m in map(self._NODE.match, names) if m)
+
+    def _read_sys(self, node: int, attr: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.sys_dir, f'video{node}', attr), encoding='utf-8') as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def signature(self) -> Optional[Hashable]:
+        return tuple(self._nodes())
+
+    def list_devices(self) -> List[Device]:
+        devices = []
+        for node in self._nodes():
+            if self._read_sys(node, 'index') not in (None, '0'):
+                continue
+            devices.append(Device(node, self._read_sys(node, 'name') or f'/dev/video{node}'))
+        return devices
+
+
+class ProbeDeviceBackend(DeviceBackend):
+    """Fallback for platforms without an enumeration API: try opening indices 0..max_index once.
+
+    Probing opens the cameras, so it only runs on the first scan and on refresh().
+    """
+
+    def __init__(self, max_index: int = PROBE_MAX_INDEX) -> None:
+        self.max_index = max_index
+
+    def signature(self) -> Optional[Hashable]:
+        return 'probed'
+
+    def list_devices(self) -> List[Device]:
+        import cv2
+        devices = []
+        for index in range(self.max_index + 1):
+            cap = cv2.VideoCapture(index)
+            if cap.isOpened():
+                devices.append(Device(index, f'Camera {index}'))
+            cap.release()
+        return devices
+
+
+def default_backend() -> DeviceBackend:
+    if sys.platform == 'win32':
+        return DShowDeviceBackend()
+    if sys.platform.startswith('linux'):
+        return V4L2DeviceBackend()
+    return ProbeDeviceBackend()
+
+
+class DeviceDiscovery:
+    """Keeps a cached device list up to date from a background thread.
+
+    The backend is polled every `interval` seconds through its cheap
+    signature() and only rescanned when that changes (or on refresh()).
+    Subscribers are called from the discovery thread with the new list
+    whenever it differs from the cached one, including the first scan.
+    """
+
+    def __init__(self, backend: Optional[DeviceBackend] = None, interval: float = DISCOVERY_INTERVAL) -> None:
+        self.backend = backend
+        self.interval = interval
+        self.devices: List[Device] = []
+        self.scans: int = 0
+        self.ready = threading.Event()
+        self._callbacks: List[Callable[[List[Device]], None]] = []
+        self._signature: Optional[Hashable] = None
+        self._rescan = False
+        self._running = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Callable[[List[Device]], None]) -> None:
+        """Add a subscriber; subscribing the same callback again has no effect."""
+        with self._cond:
+            if callback not in self._callbacks:
+                self._callbacks = self._callbacks + [callback]
+
+    def unsubscribe(self, callback: Callable[[List[Device]], None]) -> None:
+        with self._cond:
+            self._callbacks = [c for c in self._callbacks if c != callback]
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name='device-discovery', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def refresh(self) -> None:
+        """Force a full rescan on the discovery thread."""
+        with self._cond:
+            self._rescan = True
+            self._cond.notify_all()
+
+    def _scan(self) -> None:
+        signature = self.backend.signature()
+        if signature is not None and signature == self._signature and not self._rescan:
+            return
+        self._rescan = False
+        self._signature = signature
+        devices = self.backend.list_devices()
+        self.scans += 1
+        if devices != self.devices or not self.ready.is_set():
+            self.devices = devices
+            logging.info(f"Capture devices: {[device.name for device in devices]}")
+            for callback in self._callbacks:
+                try:
+                    callback(devices)
+                except Exception as e:
+                    logging.error(f"Device list subscriber failed: {e}")
+        self.ready.set()
+
+    def _run(self) -> None:
+        try:
+            if self.backend is None:
+                self.backend = default_backend()
+            self.backend.open()
+        except Exception as e:
+            logging.error(f"Device discovery unavailable: {e}")
+            self.ready.set()
+            return
+        try:
+            while self._running:
+                try:
+                    self._scan()
+                except Exception as e:
+                    logging.error(f"Device scan failed: {e}")
+                    self.ready.set()
+                with self._cond:
+                    if self._running and not self._rescan:
+                        self._cond.wait(self.interval)
+        finally:
+            self.backend.close()
@@ -0,0 +1,54 @@
+import unittest
+from Devices import Device, DeviceBackend, DeviceDiscovery
+
+
+class FakeBackend(DeviceBackend):
+
+    def __init__(self) -> None:
+        self.devices = [Device(0, 'Camera')]
+        self.scans = 0
+
+    def signature(self):
+        return tuple(self.devices)
+
+    def list_devices(self):
+        self.scans += 1
+        return list(self.devices)
+
+
+class DeviceDiscoveryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.backend = FakeBackend()
+        self.discovery = DeviceDiscovery(self.backend)
+
+    def test_rescans_only_when_signature_changes(self) -> None:
+        self.discovery._scan()
+        self.discovery._scan()
+        self.assertEqual(self.backend.scans, 1)
+        self.backend.devices.append(Device(1, 'Capture card'))
+        self.discovery._scan()
+        self.assertEqual(self.backend.scans, 2)
+        self.assertEqual(self.discovery.devices, self.backend.devices)
+
+    def test_subscribe_is_idempotent(self) -> None:
+        updates = []
+        self.discovery.subscribe(updates.append)
+        self.discovery.subscribe(updates.append)
+        self.discovery._scan()
+        self.assertEqual(len(updates), 1)
+        self.discovery.unsubscribe(updates.append)
+        self.backend.devices.pop()
+        self.discovery._scan()
+        self.assertEqual(len(updates), 1)
+
+    def test_backend_must_list_devices(self) -> None:
+        class Incomplete(DeviceBackend):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,321 @@
+import cv2
+import os
+import time
+import logging
+import sys
+import numpy as np
+from Capture import CameraSource
+from CursorFilter import make_cursor_filter
+from Features import FeatureExtractor, HandFeatures
+from Gestures import NO_GESTURE, GestureTable, GestureVoter
+from Governor import LatencyGovernor
+from Hands import HandState, HandTracker
+from Input import InputWorker, OSInputBackend
+from Pipeline import Pipeline, STAGE_POLL_INTERVAL
+from Recording import SessionRecorder
+from Screen import ScreenMapping
+from Services import ServiceRegistry
+from Smoothing import LandmarkSmoother
+from Tracing import FrameTrace, JsonEndpoint, Tracer
+from Volume import MemoryVolumeBackend, PycawVolumeBackend, VolumeBackend, VolumeController
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+os.environ['PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION'] = 'python'
+
+CAMERA_WIDTH, CAMERA_HEIGHT = 640, 480
+CURSOR_X_MIN, CURSOR_X_MAX = 110, 620
+CURSOR_Y_MIN, CURSOR_Y_MAX = 20, 350
+CURSOR_MONITOR, CURSOR_SPAN_ALL = None, False
+VOLUME_MIN_DIST, VOLUME_MAX_DIST = 50, 200
+CURSOR_FILTER = 'one_euro'
+CURSOR_FILTER_PARAMS = {'min_cutoff': 1.0, 'beta': 0.005, 'lookahead': 0.0}
+LANDMARK_SMOOTHING, LANDMARK_WINDOW = 'moving_average', 5
+GESTURE_WINDOW, GESTURE_THRESHOLD = 5, 4
+GESTURE_CONFIG = os.environ.get('GESTURE_CONFIG')
+SCROLL_AMOUNT = 200
+DETECTOR_MAX_HANDS = int(os.environ.get('DETECTOR_MAX_HANDS', '2'))
+PRIMARY_HAND = os.environ.get('PRIMARY_HAND', 'Right')
+TRACE_HTTP_PORT = int(os.environ.get('TRACE_HTTP_PORT', '0'))
+INFERENCE_BUDGET_MS = 30.0
+
+
+def create_detector():
+    """Build the hand detector and run it once so the first real frame isn't slow."""
+    import HandTrackingModule as Htm
+    detector = Htm.handDetector(maxHands=DETECTOR_MAX_HANDS, detectionCon=0.85, trackCon=0.8)
+    detector.findHands(np.zeros((CAMERA_HEIGHT, CAMERA_WIDTH, 3), dtype=np.uint8), draw=False,
+                       timestamp=time.perf_counter())
+    return detector
+
+
+def create_volume_backend() -> VolumeBackend:
+    if sys.platform == 'win32':
+        return PycawVolumeBackend()
+    logging.warning("No system volume backend on this platform, volume gestures are not applied.")
+    return MemoryVolumeBackend()
+
+
+services = ServiceRegistry()
+services.register('detector', create_detector)
+services.register('volume', lambda: VolumeController(create_volume_backend()))
+services.register('input', lambda: InputWorker(OSInputBackend()))
+
+
+class GestureEngine:
+    """Capture -> detection -> gesture -> input injection, independent of any UI.
+
+    With draw=False the detector skips landmark drawing and no markers are
+    painted, which is what headless runs want. A preview callback, if given to
+    start(), receives annotated frames on its own pipeline stage.
+
+    Up to DETECTOR_MAX_HANDS hands are handled. Each keeps its own HandState
+    (smoother, cursor filter, gesture vote, held buttons), keyed by handedness;
+    features for all hands come from one batched extract() per frame.
+
+    Any object with the CameraSource interface can replace the camera (e.g. a
+    Recording.ReplaySource), and a detector passed in is used instead of the
+    shared 'detector' service. While `recorder` is set, every captured frame
+    and the detected landmarks are queued to it with their capture time; its
+    own thread does the encoding and writing.
+
+    Frames travel between stages as FrameTrace objects so `tracer` can time
+    each stage and the whole capture -> cursor move path. With trace_port set,
+    stats() is served as JSON on that localhost port while the engine runs.
+    """
+
+    def __init__(self, draw: bool = True, gestures: Optional[GestureTable] = None,
+                 camera: Optional[CameraSource] = None, detector=None) -> None:
+        self.draw = draw
+        if gestures is None:
+            gestures = GestureTable.from_json(GESTURE_CONFIG) if GESTURE_CONFIG else GestureTable()
+        self.gestures = gestures
+        self.features = FeatureExtractor(max_hands=DETECTOR_MAX_HANDS)
+        self.hands = HandTracker(self.create_hand_state, PRIMARY_HAND)
+        self._smoothed = np.zeros((DETECTOR_MAX_HANDS, 21, 3), dtype=np.float32)
+        self.frame = None
+        self.trace: Optional[FrameTrace] = None
+        self.tracer = Tracer()
+        self.trace_port = TRACE_HTTP_PORT
+        self.endpoint: Optional[JsonEndpoint] = None
+        self.preview: Optional[Callable[[np.ndarray], None]] = None
+        self.camera = camera if camera is not None else CameraSource(CAMERA_WIDTH, CAMERA_HEIGHT)
+        self.pipeline: Optional[Pipeline] = None
+        self.prev_x: int = 0
+        self.prev_y: int = 0
+        self.current_mode = NO_GESTURE
+        self.detector = detector
+        self.recorder: Optional[SessionRecorder] = None
+        self.input: Optional[InputWorker] = None
+        self.volume: Optional[VolumeController] = None
+        self.screen = ScreenMapping((CURSOR_X_MIN, CURSOR_X_MAX), (CURSOR_Y_MIN, CURSOR_Y_MAX),
+                                    CURSOR_MONITOR, CURSOR_SPAN_ALL)
+        self.governor = LatencyGovernor(INFERENCE_BUDGET_MS)
+
+    @property
+    def is_running(self) -> bool:
+        return self.pipeline is not None and self.pipeline.is_running
+
+    def create_hand_state(self, label: str) -> HandState:
+        return HandState(label, LandmarkSmoother(LANDMARK_WINDOW, LANDMARK_SMOOTHING),
+                         make_cursor_filter(CURSOR_FILTER, **CURSOR_FILTER_PARAMS),
+                         GestureVoter(len(self.gestures.names), GESTURE_WINDOW, GESTURE_THRESHOLD))
+
+    def draw_marker(self, pos: Tuple[int, int], color: Tuple[int, int, int], radius: int = 5, thickness: int = cv2.FILLED) -> None:
+        if self.draw and self.frame is not None and isinstance(self.frame, np.ndarray):
+            cv2.circle(self.frame, pos, radius, color, thickness)
+
+    def draw_landmark(self, lm: np.ndarray, idx: int, color: Tuple[int, int, int]) -> None:
+        if self.draw:
+            self.draw_marker((int(lm[idx, 0]), int(lm[idx, 1])), color)
+
+    def adjust_volume(self, lm: np.ndarray, features: HandFeatures, i: int) -> None:
+        length = float(features.thumb_index[i])
+        self.volume.set_fraction(float(np.interp(length, [VOLUME_MIN_DIST, VOLUME_MAX_DIST], [0.0, 1.0])))
+
+        if self.draw and isinstance(self.frame, np.ndarray):
+            x1, y1, x2, y2 = int(lm[4, 0]), int(lm[4, 1]), int(lm[8, 0]), int(lm[8, 1])
+            cv2.line(self.frame, (x1, y1), (x2, y2), (255, 255, 255), 2)
+            self.draw_marker(((x1 + x2) // 2, (y1 + y2) // 2), (0, 0, 255))
+            self.draw_marker((x1, y1), (0, 255, 0))
+            self.draw_marker((x2, y2), (0, 255, 0))
+
+    def move_cursor(self, hand: HandState, lm: np.ndarray, features: HandFeatures, i: int) -> None:
+        target_x, target_y = self.screen.map(float(lm[12, 0]), float(lm[12, 1]))
+        x, y = hand.cursor_filter(target_x, target_y, time.perf_counter())
+        self.prev_x, self.prev_y = self.screen.clamp(x, y)
+        trace, queued = self.trace, time.perf_counter()
+        self.input.move(self.prev_x, self.prev_y, lambda: self.tracer.injected(trace, queued))
+        self.draw_landmark(lm, 12, (255, 255, 255))
+        left_click, right_click = features.clicks[i]
+        if left_click:
+            self.draw_landmark(lm, 4, (0, 255, 0))
+            if not hand.left_click_active:
+                self.input.press('left')
+                hand.left_click_active = True
+        elif hand.left_click_active:
+            self.input.release('left')
+            hand.left_click_active = False
+        if right_click:
+            self.draw_landmark(lm, 8, (0, 255, 0))
+            if not hand.right_click_active:
+                self.input.press('right')
+                hand.right_click_active = True
+        elif hand.right_click_active:
+            self.input.release('right')
+            hand.right_click_active = False
+
+    def release_buttons(self, hand: HandState) -> None:
+        if hand.left_click_active:
+            self.input.release('left')
+            hand.left_click_active = False
+        if hand.right_click_active:
+            self.input.release('right')
+            hand.right_click_active = False
+
+    def process_gestures(self, hand: HandState, lm: np.ndarray, features: HandFeatures, i: int) -> None:
+        """Run the stable gesture of hand i, (21, 3) pixel-space landmarks, if its role allows it."""
+        stable = hand.voter.update(self.gestures.classify(int(features.mask[i])))
+        action = self.gestures.actions[stable]
+        if not hand.allows(action):
+            stable, action = 0, 'none'
+        hand.mode = self.gestures.names[stable]
+        if action != 'cursor':
+            # Buttons are only driven from cursor mode; a hand leaving it, e.g.
+            # demoted to 'modifier' by a second hand, must not keep them held.
+            self.release_buttons(hand)
+
+        if action == 'cursor':
+            self.move_cursor(hand, lm, features, i)
+        elif action == 'volume':
+            self.adjust_volume(lm, features, i)
+        elif action == 'scroll_down':
+            self.input.scroll(-SCROLL_AMOUNT)
+            self.draw_landmark(lm, 8, (0, 255, 0))
+            self.draw_landmark(lm, 12, (0, 255, 0))
+        elif action == 'scroll_up':
+            self.input.scroll(SCROLL_AMOUNT)
+            self.draw_landmark(lm, 8, (0, 255, 0))
+
+    def capture_frame(self) -> Optional[FrameTrace]:
+        """Capture stage: grab the next camera frame."""
+        started = time.perf_counter()
+        frame = self.camera.read(timeout=STAGE_POLL_INTERVAL)
+        if frame is None:
+            return None
+        return FrameTrace(frame, self.tracer.record('capture', started))
+
+    def detect_frame(self, trace: FrameTrace) -> FrameTrace:
+        """Inference stage: detect the hand and act on gestures, then hand the frame to the preview."""
+        if self.detector is None:
+            self.detector = services.get('detector')
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.write_frame(trace.image, trace.captured)
+        if not self.governor.should_process():
+            return trace
+        self.trace = trace
+        started = time.perf_counter()
+        self.detector.inputScale = self.governor.scale
+        self.frame = trace.image = self.detector.findHands(trace.image, draw=self.draw,
+                                                           timestamp=trace.captured)
+        finished = self.tracer.record('inference', started)
+        self.governor.record((finished - started) * 1000.0)
+        hands = self.detector.findPositionArray(self.frame)
+        labels = self.detector.findHandedness()
+        if recorder is not None:
+            recorder.write_landmarks(hands, labels, trace.captured)
+        assigned, expired = self.hands.update(labels, hands)
+        for hand in expired:
+            self.release_buttons(hand)
+            hand.reset()
+        n = len(assigned)
+        if n:
+            started = time.perf_counter()
+            smoothed = self._smoothed[:n]
+            for i, hand in enumerate(assigned):
+                smoothed[i] = hand.smoother.update(hands[i])
+            started = self.tracer.record('smoothing', started)
+            features = self.features.extract(smoothed)
+            for i, hand in enumerate(assigned):
+                self.process_gestures(hand, smoothed[i], features, i)
+            self.tracer.record('classification', started)
+        self.current_mode = self.describe_mode(self.hands.present())
+        self.tracer.maybe_log()
+        return trace
+
+    def preview_frame(self, trace: FrameTrace) -> None:
+        """Preview stage: hand the annotated frame to the preview callback."""
+        started = time.perf_counter()
+        self.preview(trace.image)
+        self.tracer.record('preview', started)
+
+    @staticmethod
+    def describe_mode(hands: List[HandState]) -> str:
+        """Mode label for the UI: the active gestures of all tracked hands."""
+        modes = [hand.mode for hand in hands if hand.mode != NO_GESTURE]
+        return ' + '.join(modes) if modes else NO_GESTURE
+
+    def start(self, cam_index: int, preview: Optional[Callable[[np.ndarray], None]] = None) -> None:
+        """Start the pipeline on the given camera; raises if a service can't be created."""
+        self.input = services.get('input')
+        self.volume = services.get('volume')
+        self.camera.start(cam_index)
+        self.hands.reset()
+        self.governor.reset()
+        self.tracer.reset()
+        self.screen.refresh()
+        self.screen.watch()
+        self.input.start()
+        self.volume.start()
+        self.preview = preview
+        self.pipeline = Pipeline()
+        frames = self.pipeline.queue(lossless=self.camera.lossless)
+        previews = self.pipeline.queue() if preview is not None else None
+        self.pipeline.add_stage('capture', self.capture_frame, outbox=frames)
+        self.pipeline.add_stage('inference', self.detect_frame, inbox=frames, outbox=previews)
+        if preview is not None:
+            self.pipeline.add_stage('preview', self.preview_frame, inbox=previews)
+        self.pipeline.start()
+        if self.trace_port and self.endpoint is None:
+            try:
+                self.endpoint = JsonEndpoint(self.trace_port, self.stats)
+                self.endpoint.start()
+            except OSError as e:
+                logging.error(f"Cannot serve latency stats on port {self.trace_port}: {e}")
+
+    def stop(self) -> None:
+        self.camera.stop()
+        if self.pipeline is not None:
+            self.pipeline.stop()
+        self.camera.release()
+        self.screen.unwatch()
+        if self.input is not None:
+            for hand in self.hands.states.values():
+                self.release_buttons(hand)
+            self.input.flush()
+            self.input.stop()
+        if self.volume is not None:
+            self.volume.stop()
+        if self.endpoint is not None:
+            self.endpoint.close()
+            self.endpoint = None
+        logging.info(self.tracer.summary())
+        self.pipeline = None
+        self.current_mode = NO_GESTURE
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = self.pipeline.stats() if self.pipeline is not None else {}
+        stats['engine'] = {'mode': self.current_mode, 'running': self.is_running}
+        stats['hands'] = {hand.label: {'role': hand.role, 'mode': hand.mode} for hand in self.hands.present()}
+        if self.input is not None:
+            stats['input'] = {'moves_coalesced': self.input.moves_coalesced,
+                              'scrolls_dropped': self.input.scrolls_dropped}
+        if self.detector is not None:
+            stats['detector'] = self.detector.trackingStats()
+        stats['governor'] = self.governor.metrics()
+        if self.volume is not None:
+            stats['volume'] = {'requests': self.volume.requests, 'writes': self.volume.writes}
+        if self.recorder is not None:
+            stats['recorder'] = {'records': self.recorder.records, 'frames_dropped': self.recorder.frames_dropped}
+        stats['latency_ms'] = self.tracer.snapshot()
+        return stats
@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+from types import SimpleNamespace
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+if cv2 is not None:
+    from Engine import GestureEngine
+    from Input import InputWorker, RecordingBackend
+
+
+@unittest.skipIf(cv2 is None, 'OpenCV is not installed')
+class GestureEngineTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.engine = GestureEngine(draw=False, camera=SimpleNamespace(lossless=False))
+        self.backend = RecordingBackend()
+        self.engine.input = InputWorker(self.backend)
+        self.addCleanup(self.engine.input.stop)
+        # One frame of features: every finger up (Cursor) with a left click.
+        self.features = SimpleNamespace(mask=np.array([0b11111]), clicks=np.array([[True, False]]))
+        self.lm = np.full((21, 3), 100.0, dtype=np.float32)
+
+    def buttons(self):
+        self.engine.input.start()
+        self.assertTrue(self.engine.input.flush())
+        return [action for action in self.backend.actions() if action[0] != 'move']
+
+    def test_second_hand_releases_a_held_click(self) -> None:
+        tracker = self.engine.hands
+        landmarks = np.zeros((2, 21, 3), dtype=np.float32)
+        landmarks[1, 0, 0] = 300
+        for _ in range(4):
+            (hand,), _ = tracker.update(['Left'], landmarks[:1])
+            self.engine.process_gestures(hand, self.lm, self.features, 0)
+        self.assertTrue(hand.left_click_active)
+
+        # A right hand appears mid-click and takes the cursor.
+        assigned, _ = tracker.update(['Left', 'Right'], landmarks)
+        self.assertEqual(assigned[0].role, 'modifier')
+        self.engine.process_gestures(assigned[0], self.lm, self.features, 0)
+        self.assertFalse(hand.left_click_active)
+        self.assertEqual(self.buttons(), [('press', ('left',)), ('release', ('left',))])
+
+
+if __name__ == '__main__':
+    unittest.main()
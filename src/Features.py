@@ -0,0 +1,67 @@
+import numpy as np
+from typing import NamedTuple
+
+NUM_LANDMARKS = 21
+TIP_IDS = np.array([4, 8, 12, 16, 20])
+PIP_IDS = TIP_IDS - 2
+WRIST, INDEX_MCP, PINKY_MCP = 0, 5, 17
+MASK_BITS = 1 << np.arange(5, dtype=np.int64)
+
+
+class HandFeatures(NamedTuple):
+    """Per-hand pose features, each with a leading hands axis.
+
+    fingers: (H, 5) bool, thumb first, True when the finger is up.
+    mask: (H,) int, fingers packed into a 5-bit mask (thumb in bit 0).
+    pinch: (H, 4) float, thumb tip to index/middle/ring/pinky tip distance in px.
+    clicks: (H, 2) bool, left click (thumb tucked past the index tip) and right
+        click (index tip bent below its PIP joint).
+    palm_normal: (H, 3) float, unit normal of the wrist/index MCP/pinky MCP plane.
+    """
+    fingers: np.ndarray
+    mask: np.ndarray
+    pinch: np.ndarray
+    clicks: np.ndarray
+    palm_normal: np.ndarray
+
+    @property
+    def thumb_index(self) -> np.ndarray:
+        return self.pinch[:, 0]
+
+
+class FeatureExtractor:
+    """Computes HandFeatures for up to max_hands hands in one vectorized pass.
+
+    Output arrays are preallocated and reused: the returned HandFeatures views
+    are only valid until the next extract() call.
+    """
+
+    def __init__(self, max_hands: int = 2) -> None:
+        self.max_hands = max_hands
+        self._fingers = np.zeros((max_hands, 5), dtype=bool)
+        self._mask = np.zeros(max_hands, dtype=np.int64)
+        self._pinch = np.zeros((max_hands, 4), dtype=np.float32)
+        self._clicks = np.zeros((max_hands, 2), dtype=bool)
+        self._normal = np.zeros((max_hands, 3), dtype=np.float32)
+        self._delta = np.zeros((max_hands, 4, 2), dtype=np.float32)
+
+    def extract(self, landmarks: np.ndarray) -> HandFeatures:
+        """Extract features from (21, 3) or (H, 21, 3) pixel-space landmarks."""
+        lm = landmarks[np.newaxis] if landmarks.ndim == 2 else landmarks
+        n = lm.shape[0]
+        fingers, mask = self._fingers[:n], self._mask[:n]
+        pinch, clicks, normal, delta = self._pinch[:n], self._clicks[:n], self._normal[:n], self._delta[:n]
+
+        np.greater(lm[:, 4, 0], lm[:, 3, 0], out=fingers[:, 0])
+        np.less(lm[:, TIP_IDS[1:], 1], lm[:, PIP_IDS[1:], 1], out=fingers[:, 1:])
+        np.dot(fingers, MASK_BITS, out=mask)
+
+        np.subtract(lm[:, TIP_IDS[1:], :2], lm[:, 4:5, :2], out=delta)
+        np.hypot(delta[..., 0], delta[..., 1], out=pinch)
+
+        np.less(lm[:, 4, 0], lm[:, 8, 0], out=clicks[:, 0])
+        np.greater(lm[:, 8, 1], lm[:, 6, 1], out=clicks[:, 1])
+
+        normal[:] = np.cross(lm[:, INDEX_MCP] - lm[:, WRIST], lm[:, PINKY_MCP] - lm[:, WRIST])
+        normal /= np.maximum(np.linalg.norm(normal, axis=1, keepdims=True), 1e-6)
+        return HandFeatures(fingers, mask, pinch, clicks, normal)
@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from Features import MASK_BITS, FeatureExtractor
+
+
+def open_hand() -> np.ndarray:
+    """A hand with the four fingers up and the thumb folded, in pixel space."""
+    lm = np.zeros((21, 3), dtype=np.float32)
+    lm[0] = (300, 400, 0)
+    lm[1:5] = [(260, 380, 0), (240, 350, 0), (230, 320, 0), (225, 290, 0)]
+    for finger, x in enumerate((270, 300, 330, 360)):
+        base = 5 + 4 * finger
+        lm[base:base + 4] = [(x, 300, 0), (x, 250, 0), (x, 220, 0), (x, 190, 0)]
+    return lm
+
+
+class FeatureExtractorTest(unittest.TestCase):
+
+    def test_mask_bits_match_the_mask_dtype(self) -> None:
+        # np.dot writes into the preallocated mask, which needs the exact dtype;
+        # a platform-default int (int32 on Windows) would be rejected.
+        self.assertEqual(MASK_BITS.dtype, FeatureExtractor()._mask.dtype)
+
+    def test_mask_packs_fingers_thumb_first(self) -> None:
+        hands = np.stack([open_hand(), open_hand()])
+        hands[1, 8, 1] = 320  # index tip below its PIP joint
+        hands[1, 4, 0] = 250  # thumb tip out past its IP joint
+        features = FeatureExtractor(max_hands=2).extract(hands)
+        self.assertEqual(features.fingers.tolist(), [[False, True, True, True, True],
+                                                     [True, False, True, True, True]])
+        self.assertEqual(features.mask.tolist(), [0b11110, 0b11101])
+
+    def test_single_hand_and_batch_agree(self) -> None:
+        extractor = FeatureExtractor(max_hands=2)
+        single = extractor.extract(open_hand())
+        mask, pinch = single.mask.copy(), single.pinch.copy()
+        batch = extractor.extract(np.stack([open_hand(), open_hand()]))
+        self.assertEqual(batch.mask.tolist(), [mask[0]] * 2)
+        np.testing.assert_allclose(batch.pinch, np.repeat(pinch, 2, axis=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
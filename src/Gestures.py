@@ -0,0 +1,112 @@
+import json
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+NO_GESTURE = 'None'
+ACTIONS = ('none', 'cursor', 'volume', 'scroll_up', 'scroll_down')
+
+# Finger patterns are written thumb -> pinky, '1' meaning the finger is up.
+DEFAULT_GESTURES: Dict[str, List[str]] = {
+    'Cursor': ['11111', '01111', '10111'],
+    'Volume': ['11000'],
+    'Scroll ↓': ['01100'],
+    'Scroll ↑': ['01000'],
+}
+DEFAULT_ACTIONS: Dict[str, str] = {
+    'Cursor': 'cursor',
+    'Volume': 'volume',
+    'Scroll ↓': 'scroll_down',
+    'Scroll ↑': 'scroll_up',
+}
+
+
+def finger_mask(fingers: Iterable[bool]) -> int:
+    """Pack five finger states (thumb first) into a 5-bit mask, thumb in bit 0."""
+    mask = 0
+    for bit, up in enumerate(fingers):
+        if up:
+            mask |= 1 << bit
+    return mask
+
+
+def pattern_mask(pattern: str) -> int:
+    if len(pattern) != 5 or set(pattern) - {'0', '1'}:
+        raise ValueError(f"Invalid finger pattern: {pattern!r}")
+    return finger_mask(c == '1' for c in pattern)
+
+
+class GestureTable:
+    """Finger mask -> gesture lookup compiled into a 32-entry table.
+
+    Gestures are numbered by priority (the order they are given in); id 0 is
+    always 'None'. Each gesture maps to one of ACTIONS.
+    """
+
+    def __init__(self, gestures: Mapping[str, Sequence[str]] = DEFAULT_GESTURES,
+                 actions: Mapping[str, str] = DEFAULT_ACTIONS) -> None:
+        self.names: List[str] = [NO_GESTURE] + [name for name in gestures if name != NO_GESTURE]
+        self.actions: List[str] = ['none']
+        for name in self.names[1:]:
+            action = actions.get(name, 'none')
+            if action not in ACTIONS:
+                raise ValueError(f"Unknown action {action!r} for gesture {name!r}")
+            self.actions.append(action)
+        self.table: List[int] = [0] * 32
+        for gesture_id, name in enumerate(self.names[1:], start=1):
+            for pattern in gestures[name]:
+                mask = pattern_mask(pattern)
+                if self.table[mask]:
+                    raise ValueError(f"Pattern {pattern} is mapped to both {self.names[self.table[mask]]!r} and {name!r}")
+                self.table[mask] = gesture_id
+
+    @classmethod
+    def from_json(cls, path: str) -> 'GestureTable':
+        """Load {"gestures": {name: [patterns]}, "actions": {name: action}} from a JSON file."""
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+        return cls(config.get('gestures', DEFAULT_GESTURES), config.get('actions', DEFAULT_ACTIONS))
+
+    def classify(self, mask: int) -> int:
+        return self.table[mask]
+
+
+class GestureVoter:
+    """Sliding-window stability vote over gesture ids with O(1) updates.
+
+    A gesture becomes stable once it fills at least `threshold` of the last
+    `window` frames; ties go to the gesture with the lower id (higher priority).
+    """
+
+    def __init__(self, num_gestures: int, window: int = 5, threshold: int = 4) -> None:
+        self.window = window
+        self.threshold = threshold
+        self.counts: List[int] = [0] * num_gestures
+        self._ring: List[int] = [0] * window
+        self._index: int = 0
+        self._filled: int = 0
+        self.stable: int = 0
+
+    def reset(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self._index = 0
+        self._filled = 0
+        self.stable = 0
+
+    def update(self, gesture_id: int) -> int:
+        """Add one frame's raw gesture and return the stable gesture id (0 if none)."""
+        if self._filled == self.window:
+            self.counts[self._ring[self._index]] -= 1
+        else:
+            self._filled += 1
+        self._ring[self._index] = gesture_id
+        self._index = (self._index + 1) % self.window
+        self.counts[gesture_id] += 1
+
+        stable = self.stable
+        if stable and self.counts[stable] < self.threshold:
+            # Only the previous winner losing its majority needs a scan; any
+            # other gesture can only have gained votes from this frame.
+            stable = next((g for g in range(1, len(self.counts)) if self.counts[g] >= self.threshold), 0)
+        if gesture_id and self.counts[gesture_id] >= self.threshold and (not stable or gesture_id < stable):
+            stable = gesture_id
+        self.stable = stable
+        return stable
@@ -0,0 +1,97 @@
+import logging
+from typing import Any, Dict, Optional, Sequence
+
+TARGET_LATENCY_MS = 30.0
+INFERENCE_SCALES = (1.0, 0.75, 0.5)
+MAX_FRAME_SKIP = 2
+
+
+class LatencyGovernor:
+    """Trades inference quality for latency to hold a per-frame budget.
+
+    The smoothed inference latency is compared against target_ms. Over budget,
+    the governor first lowers the inference resolution step by step, then starts
+    skipping frames (processing one in skip + 1). Once latency falls below
+    headroom * target_ms it undoes those steps in reverse order. After each
+    change it waits `patience` processed frames before deciding again.
+    """
+
+    def __init__(self, target_ms: float = TARGET_LATENCY_MS, scales: Sequence[float] = INFERENCE_SCALES,
+                 max_skip: int = MAX_FRAME_SKIP, headroom: float = 0.7, patience: int = 15,
+                 smoothing: float = 0.2) -> None:
+        self.target_ms = target_ms
+        self.scales = tuple(scales)
+        self.max_skip = max_skip
+        self.headroom = headroom
+        self.patience = patience
+        self.smoothing = smoothing
+        self.scale_index: int = 0
+        self.skip: int = 0
+        self.latency_ms: float = 0.0
+        self.processed: int = 0
+        self.skipped: int = 0
+        self.decisions: int = 0
+        self._frame: int = 0
+        self._since_change: int = 0
+
+    @property
+    def scale(self) -> float:
+        return self.scales[self.scale_index]
+
+    def reset(self) -> None:
+        self.scale_index = 0
+        self.skip = 0
+        self.latency_ms = 0.0
+        self._frame = 0
+        self._since_change = 0
+
+    def should_process(self) -> bool:
+        """Return False for frames the detector should skip under the current policy."""
+        self._frame += 1
+        if self.skip and self._frame % (self.skip + 1):
+            self.skipped += 1
+            return False
+        return True
+
+    def record(self, latency_ms: float) -> None:
+        """Feed the inference latency of a processed frame and adjust the policy if needed."""
+        self.processed += 1
+        if self.latency_ms == 0.0:
+            self.latency_ms = latency_ms
+        else:
+            self.latency_ms += self.smoothing * (latency_ms - self.latency_ms)
+        self._since_change += 1
+        if self._since_change < self.patience:
+            return
+
+        if self.latency_ms > self.target_ms:
+            if self.scale_index < len(self.scales) - 1:
+                self._change(scale_index=self.scale_index + 1)
+            elif self.skip < self.max_skip:
+                self._change(skip=self.skip + 1)
+        elif self.latency_ms < self.target_ms * self.headroom:
+            if self.skip:
+                self._change(skip=self.skip - 1)
+            elif self.scale_index:
+                self._change(scale_index=self.scale_index - 1)
+
+    def _change(self, scale_index: Optional[int] = None, skip: Optional[int] = None) -> None:
+        if scale_index is not None:
+            self.scale_index = scale_index
+        if skip is not None:
+            self.skip = skip
+        self._since_change = 0
+        self.decisions += 1
+        logging.info(f"Governor: inference latency {self.latency_ms:.1f} ms (budget {self.target_ms:.0f} ms), "
+                     f"scale {self.scale:.2f}, processing 1 of {self.skip + 1} frames")
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'latency_ms': round(self.latency_ms, 2),
+            'target_ms': self.target_ms,
+            'scale': self.scale,
+            'skip': self.skip,
+            'processed': self.processed,
+            'skipped': self.skipped,
+            'decisions': self.decisions,
+        }
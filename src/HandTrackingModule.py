@@ -1,48 +1,180 @@
 import cv2
+import numpy as np
 import mediapipe as mp
 
+NUM_LANDMARKS = 21
+# Result fields the detector reads; the world landmarks are never decoded.
+DETECTOR_OUTPUTS = ('multi_hand_landmarks', 'multi_handedness')
+# MediaPipe labels handedness as seen in a mirrored (selfie) image.
+MIRRORED_LABELS = {'Left': 'Right', 'Right': 'Left'}
+
 
 class handDetector():
-    def __init__(self, mode=False, maxHands=2, detectionCon=0.5, trackCon=0.5):
+    def __init__(self, mode=False, maxHands=2, detectionCon=0.5, trackCon=0.5, mirrored=False):
         self.mode = mode
         self.maxHands = maxHands
         self.detectionCon = detectionCon
         self.trackCon = trackCon
+        self.mirrored = mirrored
+        self.inputScale = 1.0
+        self.trackedFrames = 0
+        self.detectionFrames = 0
+        self._timestampUs = 0
 
         self.mpHands = mp.solutions.hands
         self.hands = self.mpHands.Hands(
             static_image_mode=self.mode,
             max_num_hands=self.maxHands,
             min_detection_confidence=self.detectionCon,
-            min_tracking_confidence=self.trackCon
+            min_tracking_confidence=self.trackCon,
+            landmark_arrays=True
         )
 
-        self.mpDraw = mp.solutions.drawing_utils
+        self.connections = np.array(sorted(self.mpHands.HAND_CONNECTIONS))
+        self.results = None
+        self.landmarks = np.zeros((self.maxHands, NUM_LANDMARKS, 3), dtype=np.float32)
+        self.numHands = 0
+        self.handedness = []
+        self._pixelBuffers = {}
+        self._buffers = {}
+        self._filledFrom = None
 
-    def findHands(self, img, draw=True):
-        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        self.results = self.hands.process(imgRGB)
+    def findHands(self, img, draw=True, timestamp=None):
+        """Detect hands in img, counting whether the graph tracked them or ran palm detection.
 
-        if self.results.multi_hand_landmarks:
-            for handLms in self.results.multi_hand_landmarks:
-                if draw:
-                    self.mpDraw.draw_landmarks(img, handLms,
-                                               self.mpHands.HAND_CONNECTIONS)
+        timestamp is the frame's capture time in seconds on a monotonic clock
+        (e.g. time.perf_counter()), so the graph's tracking and landmark
+        smoothing follow the real frame rate; without it 30 fps is assumed.
+
+        In video mode the graph skips palm detection while the previous frame
+        found maxHands hands and derives this frame's hand regions from their
+        landmarks; otherwise it searches the whole frame again.
+        """
+        if not self.mode and self._handCount(self.results) >= self.maxHands:
+            self.trackedFrames += 1
+        else:
+            self.detectionFrames += 1
+        self.results = self._process(img, timestamp)
+
+        if draw and self._handCount(self.results):
+            self._drawLandmarks(img, self.results.multi_hand_landmarks)
         return img
 
-    def findPosition(self, img, handNo=0, draw=True, color = (255, 0, 255), z_axis=False):
+    @staticmethod
+    def _handCount(results):
+        hands = results.multi_hand_landmarks if results is not None else None
+        return 0 if hands is None else len(hands)
+
+    def _drawLandmarks(self, img, hands):
+        """Draw (hands, 21, 3) normalized landmarks and their connections like mediapipe's drawing_utils."""
+        h, w = img.shape[:2]
+        points = (hands[:, :, :2] * (w, h)).astype(np.int32).tolist()
+        for hand in points:
+            for start, end in self.connections:
+                cv2.line(img, tuple(hand[start]), tuple(hand[end]), (224, 224, 224), 2)
+            for point in hand:
+                cv2.circle(img, tuple(point), 2, (0, 0, 255), 2)
+
+    def _frameBuffer(self, name, shape):
+        """Contiguous uint8 view of the given shape over a reused, grow-only buffer."""
+        size = shape[0] * shape[1] * shape[2]
+        flat = self._buffers.get(name)
+        if flat is None or flat.size < size:
+            flat = self._buffers[name] = np.empty(size, dtype=np.uint8)
+        return flat[:size].reshape(shape)
+
+    def _nextTimestamp(self, timestamp):
+        """Microsecond graph timestamp for a capture time, kept strictly increasing.
+
+        The graph rejects a repeated timestamp, so a capture time that does not
+        advance (e.g. a looped replay) is nudged one microsecond past the
+        previous graph input.
+        """
+        if timestamp is None:
+            return None
+        self._timestampUs = max(int(timestamp * 1e6), self._timestampUs + 1)
+        return self._timestampUs
 
+    def _process(self, img, timestamp=None):
+        """Run the model on a BGR image, downscaled by inputScale first (landmarks are normalized).
+
+        The RGB conversion lands in a reused buffer that is handed to MediaPipe
+        read-only, so the ImageFrame packet references it instead of copying it.
+        """
+        if self.inputScale < 1.0:
+            h, w = img.shape[:2]
+            size = (max(1, int(w * self.inputScale)), max(1, int(h * self.inputScale)))
+            small = self._frameBuffer('resized', (size[1], size[0], 3))
+            img = cv2.resize(img, size, dst=small, interpolation=cv2.INTER_AREA)
+        rgb = self._frameBuffer('rgb', img.shape)
+        cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=rgb)
+        rgb.flags.writeable = False
+        return self.hands.process(rgb, self._nextTimestamp(timestamp), outputs=DETECTOR_OUTPUTS)
+
+    def trackingStats(self):
+        frames = self.trackedFrames + self.detectionFrames
+        return {
+            'tracked_frames': self.trackedFrames,
+            'detection_frames': self.detectionFrames,
+            'hit_rate': round(self.trackedFrames / frames, 3) if frames else 0.0,
+        }
+
+    def _fillLandmarks(self):
+        """Copy the latest results into the normalized (maxHands, 21, 3) landmark buffer, once per result."""
+        if self._filledFrom is self.results:
+            return self.numHands
+        self._filledFrom = self.results
+        n = min(self._handCount(self.results), self.maxHands)
+        if not n:
+            self.numHands = 0
+            self.handedness = []
+            return 0
+        self.landmarks[:n] = self.results.multi_hand_landmarks[:n]
+        labels = self.results.multi_handedness or []
+        self.handedness = [hand.classification[0].label for hand in labels[:n]]
+        if not self.mirrored:
+            self.handedness = [MIRRORED_LABELS.get(label, label) for label in self.handedness]
+        self.numHands = n
+        return n
+
+    def findHandedness(self):
+        """Return the 'Left'/'Right' label of each hand, in findPositionArray order.
+
+        Labels name the user's physical hands. MediaPipe assumes mirrored
+        (selfie) input, so for the unflipped camera frames used here
+        (mirrored=False) its labels are swapped.
+        """
+        self._fillLandmarks()
+        return self.handedness
+
+    def findPositionArray(self, img=None, normalized=False, dtype=np.float32):
+        """Return a (hands, 21, 3) array of x, y, z for every detected hand.
+
+        With normalized=True this is a view of the normalized landmarks. Otherwise
+        x and y are scaled to img's pixel size (z stays normalized) into a reused
+        float32 or int32 buffer. The returned array is overwritten by the next call.
+        """
+        n = self._fillLandmarks()
+        if normalized:
+            return self.landmarks[:n]
+        h, w = img.shape[:2]
+        buf = self._pixelBuffers.get(np.dtype(dtype))
+        if buf is None:
+            buf = self._pixelBuffers[np.dtype(dtype)] = np.zeros_like(self.landmarks, dtype=dtype)
+        np.multiply(self.landmarks[:n], (w, h, 1), out=buf[:n], casting='unsafe')
+        return buf[:n]
+
+    def findPosition(self, img, handNo=0, draw=True, color = (255, 0, 255), z_axis=False):
+        """List-of-lists adapter over findPositionArray for [id, cx, cy(, cz)] callers."""
         lmList = []
-        if self.results.multi_hand_landmarks:
-            myHand = self.results.multi_hand_landmarks[handNo]
-            for id, lm in enumerate(myHand.landmark):
-                h, w, c = img.shape
+        points = self.findPositionArray(img)
+        if handNo < len(points):
+            for id, (x, y, z) in enumerate(points[handNo].tolist()):
+                cx, cy = int(x), int(y)
                 if z_axis == False:
-                   cx, cy = int(lm.x * w), int(lm.y * h)
                    lmList.append([id, cx, cy])
                 elif z_axis:
-                    cx, cy, cz = int(lm.x * w), int(lm.y * h), round(lm.z,3)
-                    lmList.append([id, cx, cy, cz])
+                    lmList.append([id, cx, cy, round(z, 3)])
 
                 if draw:
                     cv2.circle(img, (cx, cy),5,color, cv2.FILLED)
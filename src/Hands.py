@@ -0,0 +1,118 @@
+import numpy as np
+from CursorFilter import CursorFilter
+from Gestures import ACTIONS, NO_GESTURE, GestureVoter
+from Smoothing import LandmarkSmoother
+from typing import Callable, Dict, List, Sequence, Tuple
+
+HANDEDNESS = ('Right', 'Left')
+PRIMARY_HAND = 'Right'
+HAND_TIMEOUT_FRAMES = 30
+# Alone, a hand is 'primary' and may run any action. With two hands the
+# primary_hand label drives the cursor and the other one the modifiers.
+ROLE_ACTIONS: Dict[str, frozenset] = {
+    'primary': frozenset(ACTIONS),
+    'cursor': frozenset(('none', 'cursor')),
+    'modifier': frozenset(('none', 'volume', 'scroll_up', 'scroll_down')),
+}
+
+
+class HandState:
+    """Per-hand state carried between frames: filters, gesture vote and held buttons."""
+
+    def __init__(self, label: str, smoother: LandmarkSmoother, cursor_filter: CursorFilter,
+                 voter: GestureVoter) -> None:
+        self.label = label
+        self.smoother = smoother
+        self.cursor_filter = cursor_filter
+        self.voter = voter
+        self.role = 'primary'
+        self.mode = NO_GESTURE
+        self.left_click_active: bool = False
+        self.right_click_active: bool = False
+        self.present: bool = False
+        self.missing: int = 0
+        self.wrist = np.zeros(2, dtype=np.float32)
+
+    def allows(self, action: str) -> bool:
+        return action in ROLE_ACTIONS[self.role]
+
+    def reset(self) -> None:
+        self.smoother.reset()
+        self.cursor_filter.reset()
+        self.voter.reset()
+        self.role = 'primary'
+        self.mode = NO_GESTURE
+        self.present = False
+        self.missing = 0
+
+
+class HandTracker:
+    """Matches detected hands to HandState by handedness and assigns their roles.
+
+    States are created once per label and reused. When both hands in a frame get
+    the same label (MediaPipe does this with crossed or edge-on hands), the hand
+    nearer that state's last wrist position keeps it and the other takes the
+    opposite label, so each physical hand keeps its own filters and buttons.
+    A missing state drops its gesture mode right away, and one that goes
+    unseen for `timeout` frames is reported as expired; the caller releases
+    whatever it holds and resets it.
+    """
+
+    def __init__(self, factory: Callable[[str], HandState], primary_hand: str = PRIMARY_HAND,
+                 timeout: int = HAND_TIMEOUT_FRAMES) -> None:
+        if primary_hand not in HANDEDNESS:
+            raise ValueError(f"Unknown primary hand: {primary_hand!r}")
+        self.primary_hand = primary_hand
+        self.timeout = timeout
+        self.states: Dict[str, HandState] = {label: factory(label) for label in HANDEDNESS}
+        self._assigned: List[HandState] = []
+        self._expired: List[HandState] = []
+
+    @staticmethod
+    def opposite(label: str) -> str:
+        return HANDEDNESS[1] if label == HANDEDNESS[0] else HANDEDNESS[0]
+
+    def reset(self) -> None:
+        for state in self.states.values():
+            state.reset()
+
+    def present(self) -> List[HandState]:
+        return [state for state in self.states.values() if state.present]
+
+    def update(self, labels: Sequence[str], landmarks: np.ndarray) -> Tuple[List[HandState], List[HandState]]:
+        """Assign this frame's hands, (H, 21, 3) landmarks in labels order, to states.
+
+        Returns the states aligned with the hands and the states that just expired.
+        Both lists are reused by the next call.
+        """
+        n = min(len(landmarks), len(self.states))
+        assigned, expired = self._assigned, self._expired
+        assigned.clear()
+        expired.clear()
+        for i in range(n):
+            label = labels[i] if i < len(labels) and labels[i] in self.states else None
+            if label is None or any(state.label == label for state in assigned):
+                label = self.primary_hand if not assigned else self.opposite(assigned[0].label)
+            assigned.append(self.states[label])
+        if n == 2 and len(labels) >= 2 and labels[0] == labels[1] and labels[0] in self.states:
+            # Same label twice: the hand nearer that state's last wrist keeps it.
+            state = self.states[labels[0]]
+            if state.present and (np.linalg.norm(landmarks[1, 0, :2] - state.wrist)
+                                  < np.linalg.norm(landmarks[0, 0, :2] - state.wrist)):
+                assigned.reverse()
+
+        for i, state in enumerate(assigned):
+            state.present = True
+            state.missing = 0
+            state.wrist[:] = landmarks[i, 0, :2]
+            if n == 1:
+                state.role = 'primary'
+            else:
+                state.role = 'cursor' if state.label == self.primary_hand else 'modifier'
+        for state in self.states.values():
+            if state.present and state not in assigned:
+                state.mode = NO_GESTURE
+                state.missing += 1
+                if state.missing >= self.timeout:
+                    expired.append(state)
+        return assigned, expired
@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+from Gestures import NO_GESTURE
+from Hands import HandState, HandTracker
+
+
+def make_state(label: str) -> HandState:
+    return HandState(label, smoother=None, cursor_filter=None, voter=None)
+
+
+def hands(*wrists) -> np.ndarray:
+    landmarks = np.zeros((len(wrists), 21, 3), dtype=np.float32)
+    landmarks[:, 0, :2] = wrists
+    return landmarks
+
+
+class HandTrackerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tracker = HandTracker(make_state, primary_hand='Right', timeout=3)
+
+    def test_roles(self) -> None:
+        assigned, _ = self.tracker.update(['Left'], hands((0.2, 0.5)))
+        self.assertEqual([(s.label, s.role) for s in assigned], [('Left', 'primary')])
+        assigned, _ = self.tracker.update(['Left', 'Right'], hands((0.2, 0.5), (0.8, 0.5)))
+        self.assertEqual([(s.label, s.role) for s in assigned], [('Left', 'modifier'), ('Right', 'cursor')])
+
+    def test_missing_hand_drops_mode_before_expiry(self) -> None:
+        assigned, _ = self.tracker.update(['Left', 'Right'], hands((0.2, 0.5), (0.8, 0.5)))
+        for state in assigned:
+            state.mode = 'volume'
+        _, expired = self.tracker.update(['Right'], hands((0.8, 0.5)))
+        left, right = self.tracker.states['Left'], self.tracker.states['Right']
+        self.assertEqual(expired, [])
+        self.assertTrue(left.present)
+        self.assertEqual(left.mode, NO_GESTURE)
+        self.assertEqual(right.mode, 'volume')
+        self.tracker.update(['Right'], hands((0.8, 0.5)))
+        _, expired = self.tracker.update(['Right'], hands((0.8, 0.5)))
+        self.assertEqual(expired, [left])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import sys
+import json
+import signal
+import logging
+import argparse
+import threading
+import socketserver
+from Engine import CAMERA_HEIGHT, CAMERA_WIDTH, GestureEngine, services
+from Gestures import GestureTable
+from Recording import ReplaySource, SessionRecorder
+from typing import Any, Dict, Optional
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+CONTROL_HOST = '127.0.0.1'
+STATS_LOG_INTERVAL = 30.0
+
+
+class HeadlessController:
+    """Runs the gesture engine without a window and serves start/stop/stats commands."""
+
+    def __init__(self, camera: int, gestures: Optional[GestureTable] = None,
+                 replay: Optional[ReplaySource] = None) -> None:
+        self.camera = camera
+        self.engine = GestureEngine(draw=False, gestures=gestures, camera=replay,
+                                    detector=replay.detector if replay is not None else None)
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+
+    def command(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            if name == 'start':
+                if not self.engine.is_running:
+                    self.engine.start(self.camera)
+            elif name == 'stop':
+                if self.engine.is_running:
+                    self.engine.stop()
+            elif name == 'quit':
+                if self.engine.is_running:
+                    self.engine.stop()
+                self.done.set()
+            elif name != 'stats':
+                return {'error': f'unknown command: {name}'}
+            return {'ok': True, 'stats': self.engine.stats()}
+
+    def log_stats(self) -> None:
+        logging.info(f"Stats: {json.dumps(self.engine.stats())}")
+
+    def finish_replay(self, replay: ReplaySource) -> None:
+        """Quit once the replay has run out and the pipeline has processed its last frame."""
+        replay.finished.wait()
+        if self.engine.pipeline is not None:
+            self.engine.pipeline.drain()
+        self.log_stats()
+        self.done.set()
+
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    """Line protocol: one command per line (start, stop, stats, quit), one JSON reply per line."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            name = line.decode('utf-8', 'replace').strip().lower()
+            if not name:
+                continue
+            try:
+                reply = self.server.controller.command(name)
+            except Exception as e:
+                reply = {'error': str(e)}
+            self.wfile.write((json.dumps(reply) + '\n').encode('utf-8'))
+            if name == 'quit':
+                return
+
+
+class ControlServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port: int, controller: HeadlessController) -> None:
+        super().__init__((CONTROL_HOST, port), ControlHandler)
+        self.controller = controller
+
+
+def install_signal_handlers(controller: HeadlessController) -> None:
+    """SIGINT/SIGTERM quit; where available SIGUSR1 logs stats and SIGUSR2 toggles start/stop."""
+    def quit_handler(_signum, _frame) -> None:
+        controller.done.set()
+
+    signal.signal(signal.SIGINT, quit_handler)
+    signal.signal(signal.SIGTERM, quit_handler)
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, lambda _s, _f: controller.log_stats())
+    if hasattr(signal, 'SIGUSR2'):
+        def toggle(_signum, _frame) -> None:
+            threading.Thread(target=controller.command,
+                             args=('stop' if controller.engine.is_running else 'start',), daemon=True).start()
+        signal.signal(signal.SIGUSR2, toggle)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Run gesture mouse control without the UI.')
+    parser.add_argument('--camera', type=int, default=0, help='camera index (default: 0)')
+    parser.add_argument('--control-port', type=int, default=0,
+                        help=f'serve start/stop/stats/quit on {CONTROL_HOST}:PORT (default: disabled)')
+    parser.add_argument('--stats-interval', type=float, default=STATS_LOG_INTERVAL,
+                        help='seconds between stats log lines, 0 to disable')
+    parser.add_argument('--gestures', help='JSON file with a custom gesture -> action map')
+    parser.add_argument('--paused', action='store_true', help='wait for a start command before capturing')
+    parser.add_argument('--trace-port', type=int, default=0,
+                        help=f'serve stats and latency histograms as JSON on http://{CONTROL_HOST}:PORT/')
+    parser.add_argument('--record', metavar='PATH', help='record the session to PATH')
+    parser.add_argument('--record-what', choices=('both', 'frames', 'landmarks'), default='both',
+                        help='what to record (default: both)')
+    parser.add_argument('--replay', metavar='PATH', help='read frames from a recording instead of the camera')
+    parser.add_argument('--replay-landmarks', action='store_true',
+                        help='replay recorded landmarks instead of running the detector on recorded frames')
+    parser.add_argument('--max-speed', action='store_true',
+                        help='replay as fast as possible, without dropping frames, instead of in real time')
+    args = parser.parse_args(argv)
+
+    replay = None
+    if args.replay:
+        replay = ReplaySource(args.replay, realtime=not args.max_speed, use_landmarks=args.replay_landmarks)
+    controller = HeadlessController(args.camera, GestureTable.from_json(args.gestures) if args.gestures else None,
+                                    replay)
+    if args.trace_port:
+        controller.engine.trace_port = args.trace_port
+    if args.record:
+        controller.engine.recorder = SessionRecorder(args.record, CAMERA_WIDTH, CAMERA_HEIGHT,
+                                                     frames=args.record_what != 'landmarks',
+                                                     landmarks=args.record_what != 'frames')
+    if replay is not None:
+        threading.Thread(target=controller.finish_replay, args=(replay,), name='replay-watch', daemon=True).start()
+    install_signal_handlers(controller)
+    server: Optional[ControlServer] = None
+    if args.control_port:
+        server = ControlServer(args.control_port, controller)
+        threading.Thread(target=server.serve_forever, name='control-server', daemon=True).start()
+        logging.info(f"Control socket listening on {CONTROL_HOST}:{args.control_port}")
+
+    names = ['volume', 'input'] if replay is not None and replay.detector is not None else ['detector', 'volume', 'input']
+    services.warm_up(*names)
+    if not args.paused:
+        try:
+            controller.command('start')
+        except Exception as e:
+            logging.error(f"Cannot start gesture control: {e}")
+            return 1
+    try:
+        while not controller.done.wait(args.stats_interval or None):
+            if controller.engine.is_running:
+                controller.log_stats()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        controller.command('quit')
+        if controller.engine.recorder is not None:
+            controller.engine.recorder.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,178 @@
+import abc
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, List, Optional, Tuple
+
+# Above the 30 fps camera rate, so a held scroll gesture keeps scrolling once
+# per frame as it always has; only faster sources (e.g. replays at max speed)
+# are limited.
+MAX_SCROLL_RATE = 40.0
+
+
+class InputBackend(abc.ABC):
+    """Interface for injecting mouse input into the OS."""
+
+    @abc.abstractmethod
+    def move(self, x: int, y: int) -> None:
+        pass
+
+    @abc.abstractmethod
+    def press(self, button: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def release(self, button: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def scroll(self, amount: int) -> None:
+        pass
+
+
+class OSInputBackend(InputBackend):
+    """autopy for cursor moves, pyautogui for buttons and the wheel (without its built-in pause)."""
+
+    def __init__(self) -> None:
+        import autopy
+        import pyautogui
+        pyautogui.FAILSAFE = False
+        self._autopy = autopy
+        self._pyautogui = pyautogui
+
+    def move(self, x: int, y: int) -> None:
+        self._autopy.mouse.move(x, y)
+
+    def press(self, button: str) -> None:
+        self._pyautogui.mouseDown(button=button, _pause=False)
+
+    def release(self, button: str) -> None:
+        self._pyautogui.mouseUp(button=button, _pause=False)
+
+    def scroll(self, amount: int) -> None:
+        self._pyautogui.scroll(amount, _pause=False)
+
+
+class RecordingBackend(InputBackend):
+    """Stand-in backend that records (timestamp, action, args) instead of touching the OS."""
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[float, str, Tuple[Any, ...]]] = []
+        self._lock = threading.Lock()
+
+    def _record(self, action: str, *args: Any) -> None:
+        with self._lock:
+            self.events.append((time.monotonic(), action, args))
+
+    def move(self, x: int, y: int) -> None:
+        self._record('move', x, y)
+
+    def press(self, button: str) -> None:
+        self._record('press', button)
+
+    def release(self, button: str) -> None:
+        self._record('release', button)
+
+    def scroll(self, amount: int) -> None:
+        self._record('scroll', amount)
+
+    def actions(self) -> List[Tuple[str, Tuple[Any, ...]]]:
+        with self._lock:
+            return [(action, args) for _, action, args in self.events]
+
+
+class InputWorker:
+    """Serves an InputBackend from a dedicated thread so the vision thread never blocks on the OS.
+
+    Queued moves are coalesced: a new target replaces a move that has not been
+    sent yet. Button events keep their order relative to moves, and scrolls are
+    limited to max_scroll_rate per second (extra requests are dropped).
+    """
+
+    def __init__(self, backend: InputBackend, max_scroll_rate: float = MAX_SCROLL_RATE) -> None:
+        self.backend = backend
+        self.scroll_interval = 1.0 / max_scroll_rate if max_scroll_rate > 0 else 0.0
+        self.moves_coalesced: int = 0
+        self.scrolls_dropped: int = 0
+        self._events: deque = deque()
+        self._cond = threading.Condition()
+        self._running = False
+        self._busy = False
+        self._last_scroll: float = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name='input-worker', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _put(self, action: str, *args: Any) -> None:
+        with self._cond:
+            self._events.append((action, args, None))
+            self._cond.notify()
+
+    def move(self, x: int, y: int, on_done: Optional[Callable[[], None]] = None) -> None:
+        """Queue a cursor move; on_done runs on the worker once the backend applied it (not if coalesced)."""
+        with self._cond:
+            if self._events and self._events[-1][0] == 'move':
+                self._events[-1] = ('move', (x, y), on_done)
+                self.moves_coalesced += 1
+                return
+            self._events.append(('move', (x, y), on_done))
+            self._cond.notify()
+
+    def press(self, button: str) -> None:
+        self._put('press', button)
+
+    def release(self, button: str) -> None:
+        self._put('release', button)
+
+    def scroll(self, amount: int) -> None:
+        now = time.monotonic()
+        if now - self._last_scroll < self.scroll_interval:
+            self.scrolls_dropped += 1
+            return
+        self._last_scroll = now
+        self._put('scroll', amount)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until every queued event has been handed to the backend."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._events or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._events:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                action, args, on_done = self._events.popleft()
+                self._busy = True
+            try:
+                getattr(self.backend, action)(*args)
+                if on_done is not None:
+                    on_done()
+            except Exception as e:
+                logging.error(f"Input injection failed ({action}{args}): {e}")
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
@@ -0,0 +1,54 @@
+import unittest
+from Input import InputBackend, InputWorker, RecordingBackend
+
+
+class InputWorkerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.backend = RecordingBackend()
+        self.worker = InputWorker(self.backend, max_scroll_rate=10.0)
+
+    def tearDown(self) -> None:
+        self.worker.stop()
+
+    def test_pending_moves_are_coalesced(self) -> None:
+        done = []
+        self.worker.move(1, 1, lambda: done.append(1))
+        self.worker.move(2, 2, lambda: done.append(2))
+        self.worker.move(3, 3, lambda: done.append(3))
+        self.worker.start()
+        self.assertTrue(self.worker.flush())
+        self.assertEqual(self.backend.actions(), [('move', (3, 3))])
+        self.assertEqual(self.worker.moves_coalesced, 2)
+        self.assertEqual(done, [3])
+
+    def test_buttons_keep_their_order_relative_to_moves(self) -> None:
+        self.worker.move(1, 1)
+        self.worker.press('left')
+        self.worker.move(2, 2)
+        self.worker.move(3, 3)
+        self.worker.release('left')
+        self.worker.start()
+        self.assertTrue(self.worker.flush())
+        self.assertEqual(self.backend.actions(), [('move', (1, 1)), ('press', ('left',)),
+                                                  ('move', (3, 3)), ('release', ('left',))])
+
+    def test_scrolls_are_rate_limited(self) -> None:
+        for _ in range(5):
+            self.worker.scroll(200)
+        self.worker.start()
+        self.assertTrue(self.worker.flush())
+        self.assertEqual(self.backend.actions(), [('scroll', (200,))])
+        self.assertEqual(self.worker.scrolls_dropped, 4)
+
+    def test_backend_must_implement_every_action(self) -> None:
+        class MoveOnlyBackend(InputBackend):
+            def move(self, x: int, y: int) -> None:
+                pass
+
+        with self.assertRaises(TypeError):
+            MoveOnlyBackend()
+
+
+if __name__ == '__main__':
+    unittest.main()
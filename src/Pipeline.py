@@ -0,0 +1,195 @@
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+STAGE_POLL_INTERVAL = 0.1
+STATS_SMOOTHING = 0.1
+
+
+class LatestQueue:
+    """Bounded hand-off queue where the newest item always wins.
+
+    When the queue is full the oldest item is dropped, so a slow consumer only
+    ever sees the most recent frames instead of an ever growing backlog. With
+    lossless=True put() waits for room instead, which makes replays
+    deterministic at the cost of back-pressure on the producer.
+    """
+
+    def __init__(self, maxsize: int = 1, lossless: bool = False) -> None:
+        self._items: deque = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self.lossless = lossless
+        self.dropped: int = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: Any) -> None:
+        with self._cond:
+            while self.lossless and len(self._items) == self._items.maxlen:
+                self._cond.wait(STAGE_POLL_INTERVAL)
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Return the oldest queued item, or None if nothing arrived within timeout."""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            if self.lossless:
+                self._cond.notify_all()
+            return item
+
+    def clear(self) -> None:
+        with self._cond:
+            self._items.clear()
+            self._cond.notify_all()
+
+
+class StageStats:
+    """Running FPS and latency counters for one pipeline stage."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.count: int = 0
+        self.fps: float = 0.0
+        self.latency_ms: float = 0.0
+        self.max_latency_ms: float = 0.0
+        self._last_tick: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, started: float, finished: float) -> None:
+        latency_ms = (finished - started) * 1000.0
+        with self._lock:
+            self.count += 1
+            if self._last_tick is not None and finished > self._last_tick:
+                fps = 1.0 / (finished - self._last_tick)
+                self.fps = fps if self.fps == 0.0 else self.fps + STATS_SMOOTHING * (fps - self.fps)
+            self._last_tick = finished
+            if self.latency_ms == 0.0:
+                self.latency_ms = latency_ms
+            else:
+                self.latency_ms += STATS_SMOOTHING * (latency_ms - self.latency_ms)
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'count': self.count,
+                'fps': round(self.fps, 1),
+                'latency_ms': round(self.latency_ms, 2),
+                'max_latency_ms': round(self.max_latency_ms, 2),
+            }
+
+
+class Stage:
+    """A worker thread that pulls from an inbox, runs its work and feeds an outbox.
+
+    Stages without an inbox are sources: their work function is called in a loop
+    and is expected to block (e.g. on a camera read). A work function returning
+    None produces nothing for the outbox.
+    """
+
+    def __init__(self, pipeline: 'Pipeline', name: str, work: Callable[..., Any],
+                 inbox: Optional[LatestQueue] = None, outbox: Optional[LatestQueue] = None) -> None:
+        self.pipeline = pipeline
+        self.name = name
+        self.work = work
+        self.inbox = inbox
+        self.outbox = outbox
+        self.stats = StageStats(name)
+        self.busy: bool = False
+        self.thread: Optional[threading.Thread] = None
+
+    def run(self) -> None:
+        try:
+            while self.pipeline.is_running:
+                if self.inbox is not None:
+                    item = self.inbox.get(timeout=STAGE_POLL_INTERVAL)
+                    if item is None:
+                        continue
+                    started = time.perf_counter()
+                    self.busy = True
+                    try:
+                        result = self.work(item)
+                    finally:
+                        self.busy = False
+                else:
+                    started = time.perf_counter()
+                    result = self.work()
+                    if result is None:
+                        continue
+                self.stats.record(started, time.perf_counter())
+                if result is not None and self.outbox is not None:
+                    self.outbox.put(result)
+        except Exception as e:
+            logging.error(f"Error in {self.name} stage: {e}")
+            self.pipeline.halt()
+
+
+class Pipeline:
+    """A chain of stages joined by latest-frame-wins queues."""
+
+    def __init__(self) -> None:
+        self.stages: List[Stage] = []
+        self.queues: List[LatestQueue] = []
+        self._running = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running.is_set()
+
+    def queue(self, maxsize: int = 1, lossless: bool = False) -> LatestQueue:
+        q = LatestQueue(maxsize, lossless)
+        self.queues.append(q)
+        return q
+
+    def add_stage(self, name: str, work: Callable[..., Any],
+                  inbox: Optional[LatestQueue] = None, outbox: Optional[LatestQueue] = None) -> Stage:
+        stage = Stage(self, name, work, inbox, outbox)
+        self.stages.append(stage)
+        return stage
+
+    def start(self) -> None:
+        self._running.set()
+        for stage in self.stages:
+            stage.thread = threading.Thread(target=stage.run, name=f'{stage.name}-stage', daemon=True)
+            stage.thread.start()
+
+    def halt(self) -> None:
+        """Signal all stages to exit without waiting for them."""
+        self._running.clear()
+        for q in self.queues:
+            q.clear()
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued item has been through its stage; False on timeout."""
+        deadline = time.monotonic() + timeout
+        while any(len(q) for q in self.queues) or any(stage.busy for stage in self.stages):
+            if time.monotonic() > deadline or not self.is_running:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self.halt()
+        current = threading.current_thread()
+        for stage in self.stages:
+            if stage.thread is not None and stage.thread is not current and stage.thread.is_alive():
+                stage.thread.join(timeout=timeout)
+            stage.thread = None
+        logging.info(f"Pipeline stats: {self.stats()}")
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        report = {stage.name: stage.stats.snapshot() for stage in self.stages}
+        for stage in self.stages:
+            if stage.inbox is not None:
+                report[stage.name]['dropped'] = stage.inbox.dropped
+        return report
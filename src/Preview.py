@@ -0,0 +1,91 @@
+import time
+import base64
+import cv2
+import numpy as np
+from typing import List, Optional
+
+PREVIEW_FORMATS = {
+    '.jpg': cv2.IMWRITE_JPEG_QUALITY,
+    '.webp': cv2.IMWRITE_WEBP_QUALITY,
+    '.png': cv2.IMWRITE_PNG_COMPRESSION,
+}
+PNG_MAX_COMPRESSION = 9
+
+
+def encode_params(flag: int, quality: int) -> List[int]:
+    """cv2.imencode params for a 0-100 quality under the given format flag.
+
+    PNG is lossless and takes a 0-9 compression level instead, so quality maps
+    onto it inversely: higher quality means a faster, lighter compression.
+    """
+    if not 0 <= quality <= 100:
+        raise ValueError(f"Quality must be between 0 and 100, got {quality}")
+    if flag == cv2.IMWRITE_PNG_COMPRESSION:
+        return [flag, round((100 - quality) * PNG_MAX_COMPRESSION / 100)]
+    return [flag, quality]
+
+
+class PreviewEncoder:
+    """Throttled, downscaled encoder for the UI preview.
+
+    Frames arriving faster than max_fps, or that barely differ from the last
+    pushed frame, are skipped before any encoding work is done. The resize and
+    comparison buffers are allocated once per frame size and reused.
+    """
+
+    def __init__(self, max_fps: float = 10.0, scale: float = 0.75, fmt: str = '.jpg',
+                 quality: int = 80, change_threshold: float = 0.5) -> None:
+        if fmt not in PREVIEW_FORMATS:
+            raise ValueError(f"Unsupported preview format: {fmt}")
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.scale = scale
+        self.fmt = fmt
+        self.params: List[int] = encode_params(PREVIEW_FORMATS[fmt], quality)
+        self.change_threshold = change_threshold
+        self.encoded: int = 0
+        self.skipped: int = 0
+        self._last_push: float = 0.0
+        self._small: Optional[np.ndarray] = None
+        self._prev: Optional[np.ndarray] = None
+
+    def reset(self) -> None:
+        self._last_push = 0.0
+        self._prev = None
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        if self.scale >= 1.0:
+            return frame
+        h, w = frame.shape[:2]
+        size = (max(1, int(w * self.scale)), max(1, int(h * self.scale)))
+        if self._small is None or self._small.shape[:2] != (size[1], size[0]) or self._small.shape[2:] != frame.shape[2:]:
+            self._small = np.empty((size[1], size[0]) + frame.shape[2:], dtype=frame.dtype)
+            self._prev = None
+        cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_AREA)
+        return self._small
+
+    def _unchanged(self, small: np.ndarray) -> bool:
+        if self._prev is None or self._prev.shape != small.shape:
+            self._prev = small.copy()
+            return False
+        diff = cv2.norm(small, self._prev, cv2.NORM_L1) / small.size
+        if diff < self.change_threshold:
+            return True
+        np.copyto(self._prev, small)
+        return False
+
+    def encode(self, frame: np.ndarray) -> Optional[str]:
+        """Return the base64 preview for frame, or None if it should not be pushed."""
+        now = time.monotonic()
+        if now - self._last_push < self.min_interval:
+            self.skipped += 1
+            return None
+        small = self._downscale(frame)
+        if self._unchanged(small):
+            self.skipped += 1
+            return None
+        ret, im_arr = cv2.imencode(self.fmt, small, self.params)
+        if not ret:
+            return None
+        self._last_push = now
+        self.encoded += 1
+        return base64.b64encode(im_arr).decode('ascii')
@@ -0,0 +1,29 @@
+import unittest
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+if cv2 is not None:
+    from Preview import PreviewEncoder, encode_params
+
+
+@unittest.skipIf(cv2 is None, 'OpenCV is not installed')
+class EncodeParamsTest(unittest.TestCase):
+
+    def test_lossy_formats_keep_the_quality(self) -> None:
+        self.assertEqual(encode_params(cv2.IMWRITE_JPEG_QUALITY, 80), [cv2.IMWRITE_JPEG_QUALITY, 80])
+
+    def test_png_quality_maps_to_a_compression_level(self) -> None:
+        levels = [encode_params(cv2.IMWRITE_PNG_COMPRESSION, q)[1] for q in (0, 80, 100)]
+        self.assertEqual(levels, [9, 2, 0])
+        self.assertEqual(PreviewEncoder(fmt='.png', quality=80).params, [cv2.IMWRITE_PNG_COMPRESSION, 2])
+
+    def test_quality_out_of_range(self) -> None:
+        with self.assertRaises(ValueError):
+            encode_params(cv2.IMWRITE_JPEG_QUALITY, 101)
+
+
+if __name__ == '__main__':
+    unittest.main()
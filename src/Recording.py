@@ -0,0 +1,329 @@
+import time
+import struct
+import logging
+import threading
+import cv2
+import numpy as np
+from collections import deque
+from Preview import encode_params
+from typing import Any, BinaryIO, Deque, Iterator, List, Optional, Sequence, Tuple
+
+RECORDING_MAGIC = b'GMREC'
+RECORDING_VERSION = 1
+HEADER = struct.Struct('<5sBHH')      # magic, version, frame width, frame height
+RECORD = struct.Struct('<BdI')        # kind, seconds since start, payload length
+FRAME, LANDMARKS = 1, 2
+HAND_LABELS = ('Right', 'Left')
+UNKNOWN_HAND = 255
+# Landmark followed by landmark_trace(): the one the cursor tracks.
+TRACE_LANDMARK = 12
+# Screen pixels per camera pixel for landmark_trace(): the default cursor box,
+# 510 camera pixels wide, spans a 1920 pixel wide screen.
+TRACE_SCALE = 3.75
+# About one second of camera frames waiting for the encoder.
+RECORDER_MAX_PENDING_FRAMES = 30
+RECORDING_FORMATS = {
+    '.jpg': cv2.IMWRITE_JPEG_QUALITY,
+    '.png': cv2.IMWRITE_PNG_COMPRESSION,
+}
+
+
+class SessionRecorder:
+    """Appends timestamped camera frames and/or landmark arrays to a session file.
+
+    The file is a small header followed by records of (kind, t, length, payload).
+    Frames are stored encoded (JPEG by default, PNG for lossless). Landmarks are
+    stored as a hand count, one handedness byte per hand and the raw float32
+    (hands, 21, 3) pixel-space array.
+
+    The write methods only queue a record, so any thread may call them without
+    paying for encoding or file I/O; a writer thread encodes frames and appends
+    records in call order. At most `max_pending` frames wait in the queue, newer
+    ones are dropped (and counted) while the disk falls behind. Timestamps are
+    perf_counter() values, such as FrameTrace.captured, and default to the time
+    of the call.
+    """
+
+    def __init__(self, path: str, width: int, height: int, frames: bool = True, landmarks: bool = True,
+                 fmt: str = '.jpg', quality: int = 90, max_pending: int = RECORDER_MAX_PENDING_FRAMES) -> None:
+        if fmt not in RECORDING_FORMATS:
+            raise ValueError(f"Unsupported recording format: {fmt}")
+        self.path = path
+        self.frames = frames
+        self.landmarks = landmarks
+        self.fmt = fmt
+        self.params: List[int] = encode_params(RECORDING_FORMATS[fmt], quality)
+        self.max_pending = max_pending
+        self.records: int = 0
+        self.frames_dropped: int = 0
+        self._pending: Deque[Tuple[int, Any, float]] = deque()
+        self._pending_frames: int = 0
+        self._cond = threading.Condition()
+        self._closing = False
+        self._file: BinaryIO = open(path, 'wb')
+        self._file.write(HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, width, height))
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='session-recorder', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'SessionRecorder':
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def _put(self, kind: int, payload: Any, captured: Optional[float]) -> bool:
+        t = max(0.0, (time.perf_counter() if captured is None else captured) - self._start)
+        with self._cond:
+            if self._closing:
+                return False
+            if kind == FRAME:
+                if self._pending_frames >= self.max_pending:
+                    self.frames_dropped += 1
+                    return False
+                self._pending_frames += 1
+            self._pending.append((kind, payload, t))
+            self._cond.notify()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                if not self._pending:
+                    break
+                kind, payload, t = self._pending.popleft()
+            if kind == FRAME:
+                ret, data = cv2.imencode(self.fmt, payload, self.params)
+                with self._cond:
+                    self._pending_frames -= 1
+                if not ret:
+                    logging.warning(f"Could not encode a frame for {self.path}")
+                    continue
+                payload = data.tobytes()
+            self._file.write(RECORD.pack(kind, t, len(payload)))
+            self._file.write(payload)
+            self.records += 1
+        self._file.close()
+
+    def write_frame(self, frame: np.ndarray, captured: Optional[float] = None) -> bool:
+        """Queue a copy of the frame; returns False if it was dropped."""
+        if not self.frames:
+            return False
+        return self._put(FRAME, frame.copy(), captured)
+
+    def write_landmarks(self, landmarks: np.ndarray, labels: Sequence[str] = (),
+                        captured: Optional[float] = None) -> None:
+        """Record (hands, 21, 3) pixel-space landmarks; an empty array records a frame without hands."""
+        if not self.landmarks:
+            return
+        n = len(landmarks)
+        codes = bytes(HAND_LABELS.index(labels[i]) if i < len(labels) and labels[i] in HAND_LABELS
+                      else UNKNOWN_HAND for i in range(n))
+        payload = bytes((n,)) + codes + np.ascontiguousarray(landmarks, dtype=np.float32).tobytes()
+        self._put(LANDMARKS, payload, captured)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop taking records; the writer thread closes the file once the queue is written out."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        if self._thread.is_alive():
+            logging.warning(f"{self.path} is still writing queued records")
+
+
+def decode_landmarks(payload: bytes) -> Tuple[np.ndarray, List[str]]:
+    n = payload[0]
+    labels = [HAND_LABELS[c] if c < len(HAND_LABELS) else '' for c in payload[1:1 + n]]
+    landmarks = np.frombuffer(payload, dtype=np.float32, offset=1 + n).reshape(n, 21, 3)
+    return landmarks, labels
+
+
+def is_session_recording(path: str) -> bool:
+    with open(path, 'rb') as f:
+        return f.read(len(RECORDING_MAGIC)) == RECORDING_MAGIC
+
+
+def landmark_trace(path: str, landmark: int = TRACE_LANDMARK, scale: float = TRACE_SCALE) -> np.ndarray:
+    """Turn the landmark records of a session into a (T, 3) [t, x, y] cursor trace for CursorFilter.replay().
+
+    Follows `landmark` on the first hand of each record, scaled from camera to
+    screen pixels; records without hands are skipped.
+    """
+    _, records = read_session(path)
+    rows = []
+    for kind, t, payload in records:
+        if kind != LANDMARKS:
+            continue
+        hands, _ = decode_landmarks(payload)
+        if len(hands):
+            rows.append((t, hands[0, landmark, 0] * scale, hands[0, landmark, 1] * scale))
+    return np.array(rows, dtype=np.float64).reshape(-1, 3)
+
+
+def read_session(path: str) -> Tuple[Tuple[int, int], Iterator[Tuple[int, float, bytes]]]:
+    """Return the recorded frame size and an iterator over raw (kind, t, payload) records."""
+    f = open(path, 'rb')
+    magic, version, width, height = HEADER.unpack(f.read(HEADER.size))
+    if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+        f.close()
+        raise ValueError(f"{path} is not a session recording (version {RECORDING_VERSION})")
+
+    def records() -> Iterator[Tuple[int, float, bytes]]:
+        with f:
+            while True:
+                head = f.read(RECORD.size)
+                if len(head) < RECORD.size:
+                    return
+                kind, t, length = RECORD.unpack(head)
+                payload = f.read(length)
+                if len(payload) < length:
+                    logging.warning(f"{path} ends with a truncated record")
+                    return
+                yield kind, t, payload
+
+    return (width, height), records()
+
+
+class ReplayDetector:
+    """Stands in for handDetector, answering with recorded landmarks instead of running the model.
+
+    Each findHands() call consumes the next landmark record queued by the
+    ReplaySource, so sources and detector stay aligned as long as no frame is
+    dropped between them (ReplaySource is lossless in landmark mode).
+    """
+
+    def __init__(self) -> None:
+        self.inputScale = 1.0
+        self.replayed: int = 0
+        self._pending: Deque[Tuple[np.ndarray, List[str]]] = deque()
+        self._empty = np.zeros((0, 21, 3), dtype=np.float32)
+        self._landmarks = self._empty
+        self._labels: List[str] = []
+
+    def push(self, landmarks: np.ndarray, labels: List[str]) -> None:
+        self._pending.append((landmarks, labels))
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    def findHands(self, img, draw=True, timestamp=None):
+        if self._pending:
+            self._landmarks, self._labels = self._pending.popleft()
+            self.replayed += 1
+        else:
+            self._landmarks, self._labels = self._empty, []
+        return img
+
+    def findPositionArray(self, img=None, normalized=False, dtype=np.float32):
+        if normalized and img is not None:
+            h, w = img.shape[:2]
+            return self._landmarks / np.array((w, h, 1), dtype=np.float32)
+        return self._landmarks.astype(dtype, copy=False)
+
+    def findHandedness(self):
+        return self._labels
+
+    def trackingStats(self):
+        return {'replayed': self.replayed}
+
+
+class ReplaySource:
+    """Plays a session recording back through the CameraSource interface.
+
+    With realtime=True records are released at their recorded pace, otherwise
+    as fast as they are consumed. Frame recordings are decoded and fed to the
+    real detector; with use_landmarks=True the recorded landmarks go to
+    `detector` (a ReplayDetector) and read() yields a blank frame of the
+    recorded size for each landmark record. `finished` is set at the end of
+    the recording (unless loop=True, which starts over).
+    """
+
+    def __init__(self, path: str, realtime: bool = True, use_landmarks: bool = False, loop: bool = False) -> None:
+        self.path = path
+        self.realtime = realtime
+        self.use_landmarks = use_landmarks
+        self.loop = loop
+        self.detector: Optional[ReplayDetector] = ReplayDetector() if use_landmarks else None
+        self.frames: int = 0
+        self.finished = threading.Event()
+        self._records: Optional[Iterator[Tuple[int, float, bytes]]] = None
+        self._blank: Optional[np.ndarray] = None
+        self._clock: float = 0.0
+        self._active = False
+        self._cond = threading.Condition()
+
+    @property
+    def lossless(self) -> bool:
+        """Whether the pipeline should hand over every frame instead of only the latest one."""
+        return self.use_landmarks or not self.realtime
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def start(self, index: int = 0) -> None:
+        with self._cond:
+            self._active = True
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._active = False
+            self._cond.notify_all()
+
+    def release(self) -> None:
+        """Rewind: the next start() replays from the beginning."""
+        with self._cond:
+            self._records = None
+            self.finished.clear()
+            if self.detector is not None:
+                self.detector.clear()
+
+    def _rewind(self) -> None:
+        (width, height), self._records = read_session(self.path)
+        self._blank = np.zeros((height, width, 3), dtype=np.uint8)
+        self._clock = time.perf_counter()
+
+    def _next(self) -> Optional[Tuple[int, float, bytes]]:
+        kind = FRAME if not self.use_landmarks else LANDMARKS
+        for record in self._records:
+            if record[0] == kind:
+                return record
+        return None
+
+    def read(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Return the next recorded frame, or None when stopped or at the end of the recording."""
+        with self._cond:
+            if not self._active:
+                self._cond.wait(timeout)
+                if not self._active:
+                    return None
+            if self.finished.is_set():
+                self._cond.wait(timeout)
+                return None
+            if self._records is None:
+                self._rewind()
+            record = self._next()
+            if record is None and self.loop:
+                self._rewind()
+                record = self._next()
+            if record is None:
+                logging.info(f"Replay of {self.path} finished after {self.frames} frames")
+                self.finished.set()
+                return None
+            _, t, payload = record
+            if self.realtime:
+                delay = self._clock + t - time.perf_counter()
+                if delay > 0 and self._cond.wait_for(lambda: not self._active, delay):
+                    return None
+        if self.use_landmarks:
+            self.detector.push(*decode_landmarks(payload))
+            frame = self._blank.copy()
+        else:
+            frame = cv2.imdecode(np.frombuffer(payload, dtype=np.uint8), cv2.IMREAD_COLOR)
+        self.frames += 1
+        return frame
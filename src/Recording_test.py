@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+if cv2 is not None:
+    from Recording import (FRAME, LANDMARKS, TRACE_SCALE, SessionRecorder, decode_landmarks,
+                           is_session_recording, landmark_trace, read_session)
+
+
+@unittest.skipIf(cv2 is None, 'OpenCV is not installed')
+class SessionRecorderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        fd, self.path = tempfile.mkstemp(suffix='.gmr')
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_records_in_call_order_with_capture_times(self) -> None:
+        recorder = SessionRecorder(self.path, 64, 48)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        landmarks = np.arange(63, dtype=np.float32).reshape(1, 21, 3)
+        recorder.write_frame(frame, recorder._start + 0.5)
+        frame[:] = 255  # the recorder keeps its own copy
+        recorder.write_landmarks(landmarks, ['Left'], recorder._start + 0.5)
+        recorder.write_landmarks(landmarks[:0], captured=recorder._start + 1.0)
+        recorder.close()
+        self.assertFalse(recorder._thread.is_alive())
+
+        size, records = read_session(self.path)
+        records = list(records)
+        self.assertEqual(size, (64, 48))
+        self.assertEqual([(kind, t) for kind, t, _ in records], [(FRAME, 0.5), (LANDMARKS, 0.5), (LANDMARKS, 1.0)])
+        decoded = cv2.imdecode(np.frombuffer(records[0][2], dtype=np.uint8), cv2.IMREAD_COLOR)
+        self.assertLess(int(decoded.max()), 16)
+        hands, labels = decode_landmarks(records[1][2])
+        np.testing.assert_array_equal(hands, landmarks)
+        self.assertEqual(labels, ['Left'])
+        self.assertEqual(len(decode_landmarks(records[2][2])[0]), 0)
+
+    def test_drops_frames_while_encoder_is_behind(self) -> None:
+        recorder = SessionRecorder(self.path, 64, 48, max_pending=2)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        with recorder._cond:
+            # Hold the queue so the writer thread cannot drain it.
+            sent = [recorder.write_frame(frame) for _ in range(3)]
+        self.assertEqual(sent, [True, True, False])
+        self.assertEqual(recorder.frames_dropped, 1)
+        recorder.close()
+        self.assertEqual(recorder.records, 2)
+
+    def test_landmark_trace_follows_the_first_hand(self) -> None:
+        with SessionRecorder(self.path, 64, 48, frames=False) as recorder:
+            landmarks = np.zeros((1, 21, 3), dtype=np.float32)
+            landmarks[0, 12, :2] = (10, 20)
+            recorder.write_landmarks(landmarks, ['Right'], recorder._start + 0.25)
+            recorder.write_landmarks(landmarks[:0], captured=recorder._start + 0.5)
+        self.assertTrue(is_session_recording(self.path))
+        np.testing.assert_allclose(landmark_trace(self.path), [[0.25, 10 * TRACE_SCALE, 20 * TRACE_SCALE]])
+
+
+if __name__ == '__main__':
+    unittest.main()
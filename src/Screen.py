@@ -0,0 +1,114 @@
+import logging
+import threading
+import autopy
+from typing import List, NamedTuple, Optional, Tuple
+
+DISPLAY_POLL_INTERVAL = 2.0
+
+
+class Monitor(NamedTuple):
+    x: int
+    y: int
+    width: int
+    height: int
+    is_primary: bool = False
+
+
+def list_monitors() -> List[Monitor]:
+    """Return the connected monitors in the same coordinate space autopy moves in."""
+    try:
+        import screeninfo
+        scale = autopy.screen.scale() or 1.0
+        monitors = [Monitor(int(m.x / scale), int(m.y / scale), int(m.width / scale), int(m.height / scale),
+                            bool(getattr(m, 'is_primary', False)))
+                    for m in screeninfo.get_monitors()]
+        if monitors:
+            return monitors
+    except Exception as e:
+        logging.debug(f"Monitor enumeration failed, using the main screen only: {e}")
+    width, height = autopy.screen.size()
+    return [Monitor(0, 0, int(width), int(height), True)]
+
+
+class ScreenMapping:
+    """Precomputed affine transform from camera pixels to screen coordinates.
+
+    The camera rectangle [x_range] x [y_range] is mapped (mirrored horizontally)
+    onto one monitor, or onto the bounding box of all monitors with span_all.
+    The coefficients are only recomputed after invalidate()/refresh(), so the
+    per-frame mapping is a couple of multiply-adds.
+    """
+
+    def __init__(self, x_range: Tuple[float, float], y_range: Tuple[float, float],
+                 monitor: Optional[int] = None, span_all: bool = False) -> None:
+        self.x_range = x_range
+        self.y_range = y_range
+        self.monitor = monitor
+        self.span_all = span_all
+        self.monitors: List[Monitor] = []
+        self._coeffs: Optional[Tuple[float, ...]] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+
+    def _target(self) -> Monitor:
+        if self.span_all:
+            left = min(m.x for m in self.monitors)
+            top = min(m.y for m in self.monitors)
+            right = max(m.x + m.width for m in self.monitors)
+            bottom = max(m.y + m.height for m in self.monitors)
+            return Monitor(left, top, right - left, bottom - top)
+        if self.monitor is not None and 0 <= self.monitor < len(self.monitors):
+            return self.monitors[self.monitor]
+        return next((m for m in self.monitors if m.is_primary), self.monitors[0])
+
+    def refresh(self) -> Tuple[float, ...]:
+        """Re-read the display layout, rebuild the transform and return its coefficients."""
+        self.monitors = list_monitors()
+        target = self._target()
+        (cx0, cx1), (cy0, cy1) = self.x_range, self.y_range
+        left, top = target.x, target.y
+        right, bottom = target.x + target.width - 1, target.y + target.height - 1
+        sx = (left - right) / (cx1 - cx0)
+        sy = (bottom - top) / (cy1 - cy0)
+        coeffs = self._coeffs = (sx, right - sx * cx0, sy, top - sy * cy0, left, right, top, bottom)
+        logging.info(f"Cursor mapped onto {target.width}x{target.height} at ({left}, {top}).")
+        return coeffs
+
+    def invalidate(self) -> None:
+        self._coeffs = None
+
+    def _current(self) -> Tuple[float, ...]:
+        # One read of _coeffs: the watcher thread may invalidate() at any time.
+        coeffs = self._coeffs
+        return coeffs if coeffs is not None else self.refresh()
+
+    def map(self, x: float, y: float) -> Tuple[float, float]:
+        """Map camera pixel coordinates to (clamped) screen coordinates."""
+        sx, ox, sy, oy, left, right, top, bottom = self._current()
+        return min(max(sx * x + ox, left), right), min(max(sy * y + oy, top), bottom)
+
+    def clamp(self, x: float, y: float) -> Tuple[int, int]:
+        """Round a screen position and keep it on the mapped display area."""
+        left, right, top, bottom = self._current()[4:]
+        return min(max(round(x), left), right), min(max(round(y), top), bottom)
+
+    def watch(self, interval: float = DISPLAY_POLL_INTERVAL) -> None:
+        """Invalidate the transform whenever the monitor layout changes, off the vision thread."""
+        if self._watcher is not None:
+            return
+        self._stop_watching.clear()
+
+        def poll() -> None:
+            while not self._stop_watching.wait(interval):
+                if self.monitors and list_monitors() != self.monitors:
+                    logging.info("Display layout changed.")
+                    self.invalidate()
+
+        self._watcher = threading.Thread(target=poll, name='display-watcher', daemon=True)
+        self._watcher.start()
+
+    def unwatch(self, timeout: float = 1.0) -> None:
+        self._stop_watching.set()
+        if self._watcher is not None and self._watcher is not threading.current_thread():
+            self._watcher.join(timeout=timeout)
+        self._watcher = None
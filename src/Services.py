@@ -0,0 +1,56 @@
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class ServiceRegistry:
+    """Creates expensive components on first use and records how long each took.
+
+    Factories are registered up front but only run when the service is first
+    requested, either by get() or by a background warm_up(). A get() racing a
+    warm-up waits for that warm-up instead of building a second instance.
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self.timings: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        self._factories[name] = factory
+        self._locks[name] = threading.Lock()
+
+    def is_ready(self, name: str) -> bool:
+        return name in self._instances
+
+    def get(self, name: str) -> Any:
+        if name in self._instances:
+            return self._instances[name]
+        with self._locks[name]:
+            if name not in self._instances:
+                started = time.perf_counter()
+                self._instances[name] = self._factories[name]()
+                self.timings[name] = (time.perf_counter() - started) * 1000.0
+                logging.info(f"Initialized {name} in {self.timings[name]:.0f} ms")
+            return self._instances[name]
+
+    def peek(self, name: str) -> Optional[Any]:
+        """Return the service if it has already been created, without creating it."""
+        return self._instances.get(name)
+
+    def warm_up(self, *names: str) -> threading.Thread:
+        """Create the given services on a background thread."""
+        def run() -> None:
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    logging.error(f"Failed to initialize {name}: {e}")
+            timings = {n: round(t) for n, t in self.timings.items()}
+            logging.info(f"Startup timings (ms): {timings}")
+
+        thread = threading.Thread(target=run, name='service-warm-up', daemon=True)
+        thread.start()
+        return thread
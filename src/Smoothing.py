@@ -0,0 +1,125 @@
+import math
+import time
+import numpy as np
+from typing import Optional, Tuple
+
+NUM_LANDMARKS = 21
+SMOOTHING_MODES = ('moving_average', 'exponential', 'one_euro')
+
+
+class OneEuroFilter:
+    """Vectorized One-Euro filter over an array of any fixed shape.
+
+    All state and scratch arrays are allocated up front; each call updates them
+    in place and returns the internal filtered array (copy it to keep it).
+    """
+
+    def __init__(self, shape: Tuple[int, ...], min_cutoff: float = 1.0, beta: float = 0.0,
+                 d_cutoff: float = 1.0, dtype=np.float32) -> None:
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self._x = np.zeros(shape, dtype=dtype)
+        self._dx = np.zeros(shape, dtype=dtype)
+        self._tmp = np.zeros(shape, dtype=dtype)
+        self._alpha = np.zeros(shape, dtype=dtype)
+        self._t: Optional[float] = None
+
+    @property
+    def value(self) -> np.ndarray:
+        return self._x
+
+    @property
+    def velocity(self) -> np.ndarray:
+        return self._dx
+
+    def reset(self) -> None:
+        self._t = None
+
+    def __call__(self, x: np.ndarray, t: float) -> np.ndarray:
+        if self._t is None:
+            np.copyto(self._x, x, casting='unsafe')
+            self._dx.fill(0)
+            self._t = t
+            return self._x
+        dt = max(t - self._t, 1e-6)
+        self._t = t
+
+        # Low-pass the derivative with a fixed cutoff.
+        a_d = 1.0 / (1.0 + 1.0 / (2 * math.pi * self.d_cutoff * dt))
+        np.subtract(x, self._x, out=self._tmp, casting='unsafe')
+        self._tmp /= dt
+        self._tmp -= self._dx
+        self._tmp *= a_d
+        self._dx += self._tmp
+
+        # Cutoff grows with speed: smooth when still, responsive when moving.
+        np.abs(self._dx, out=self._alpha)
+        self._alpha *= self.beta
+        self._alpha += self.min_cutoff
+        self._alpha *= 2 * math.pi * dt
+        np.reciprocal(self._alpha, out=self._alpha)
+        self._alpha += 1
+        np.reciprocal(self._alpha, out=self._alpha)
+
+        np.subtract(x, self._x, out=self._tmp, casting='unsafe')
+        self._tmp *= self._alpha
+        self._x += self._tmp
+        return self._x
+
+
+class LandmarkSmoother:
+    """Temporal smoothing of (21, 3) hand landmarks backed by a preallocated ring buffer.
+
+    'moving_average' keeps a running sum over the last `window` frames so each
+    update is O(1); 'exponential' blends with factor `alpha`; 'one_euro' uses a
+    speed-adaptive One-Euro filter. update() returns an internal array that is
+    overwritten by the next call.
+    """
+
+    def __init__(self, window: int = 5, mode: str = 'moving_average', alpha: float = 0.5,
+                 min_cutoff: float = 1.0, beta: float = 0.0, d_cutoff: float = 1.0,
+                 num_landmarks: int = NUM_LANDMARKS) -> None:
+        if mode not in SMOOTHING_MODES:
+            raise ValueError(f"Unknown smoothing mode: {mode}")
+        self.mode = mode
+        self.window = window
+        self.alpha = alpha
+        self._ring = np.zeros((window, num_landmarks, 3), dtype=np.float32)
+        self._sum = np.zeros((num_landmarks, 3), dtype=np.float64)
+        self._out = np.zeros((num_landmarks, 3), dtype=np.float32)
+        self._euro = OneEuroFilter((num_landmarks, 3), min_cutoff, beta, d_cutoff)
+        self._index: int = 0
+        self._count: int = 0
+
+    def reset(self) -> None:
+        self._sum.fill(0)
+        self._index = 0
+        self._count = 0
+        self._euro.reset()
+
+    def update(self, landmarks: np.ndarray, t: Optional[float] = None) -> np.ndarray:
+        """Add one frame of landmarks and return the smoothed landmarks."""
+        if self.mode == 'one_euro':
+            return self._euro(landmarks, time.perf_counter() if t is None else t)
+
+        if self.mode == 'exponential':
+            if self._count == 0:
+                np.copyto(self._out, landmarks, casting='unsafe')
+            else:
+                np.subtract(landmarks, self._out, out=self._ring[0], casting='unsafe')
+                self._ring[0] *= self.alpha
+                self._out += self._ring[0]
+            self._count = 1
+            return self._out
+
+        slot = self._ring[self._index]
+        if self._count == self.window:
+            self._sum -= slot
+        else:
+            self._count += 1
+        np.copyto(slot, landmarks, casting='unsafe')
+        self._sum += slot
+        self._index = (self._index + 1) % self.window
+        np.divide(self._sum, self._count, out=self._out, casting='unsafe')
+        return self._out
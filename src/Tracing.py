@@ -0,0 +1,188 @@
+import json
+import time
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+TRACE_STAGES = ('capture', 'inference', 'smoothing', 'classification', 'injection', 'preview')
+END_TO_END = 'end_to_end'
+TRACE_LOG_INTERVAL = 30.0
+TRACE_HOST = '127.0.0.1'
+HISTOGRAM_SUB_BITS = 7
+HISTOGRAM_MAX_US = 60_000_000
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram in microseconds.
+
+    Values below 2**sub_bits are counted exactly; above that every power of two
+    is split into 2**(sub_bits - 1) equal buckets, so any recorded value is
+    known to within 1 / 2**(sub_bits - 1) of itself (~1.6% by default) with a
+    fixed, small number of buckets. Recording is O(1) and allocation free.
+    """
+
+    def __init__(self, sub_bits: int = HISTOGRAM_SUB_BITS, max_us: int = HISTOGRAM_MAX_US) -> None:
+        self.sub_bits = sub_bits
+        self.half = 1 << (sub_bits - 1)
+        self.max_us = max_us
+        self.counts: List[int] = [0] * (self._index(max_us) + 1)
+        self.total: int = 0
+        self.sum_us: int = 0
+        self.min_us: int = 0
+        self.max_seen_us: int = 0
+        self._lock = threading.Lock()
+
+    def _index(self, value: int) -> int:
+        shift = max(0, value.bit_length() - self.sub_bits)
+        return shift * self.half + (value >> shift)
+
+    def _lower_bound(self, index: int) -> int:
+        shift = max(0, index // self.half - 1)
+        return (index - shift * self.half) << shift
+
+    def record(self, seconds: float) -> None:
+        value = min(max(int(seconds * 1e6), 0), self.max_us)
+        with self._lock:
+            self.counts[self._index(value)] += 1
+            if not self.total or value < self.min_us:
+                self.min_us = value
+            self.max_seen_us = max(self.max_seen_us, value)
+            self.total += 1
+            self.sum_us += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = [0] * len(self.counts)
+            self.total = self.sum_us = self.min_us = self.max_seen_us = 0
+
+    def percentile(self, p: float) -> float:
+        """Return the p-th percentile in milliseconds (lower edge of its bucket)."""
+        with self._lock:
+            if not self.total:
+                return 0.0
+            rank = max(1, int(p / 100.0 * self.total + 0.5))
+            seen = 0
+            for index, count in enumerate(self.counts):
+                seen += count
+                if seen >= rank:
+                    return self._lower_bound(index) / 1000.0
+            return self.max_seen_us / 1000.0
+
+    def snapshot(self, percentiles: Sequence[float] = PERCENTILES) -> Dict[str, float]:
+        report = {f'p{p:g}': round(self.percentile(p), 2) for p in percentiles}
+        with self._lock:
+            report['count'] = self.total
+            report['mean'] = round(self.sum_us / self.total / 1000.0, 2) if self.total else 0.0
+            report['min'] = round(self.min_us / 1000.0, 2)
+            report['max'] = round(self.max_seen_us / 1000.0, 2)
+        return report
+
+
+class FrameTrace:
+    """A frame travelling through the pipeline together with its capture timestamp."""
+
+    __slots__ = ('image', 'captured')
+
+    def __init__(self, image: Any, captured: float) -> None:
+        self.image = image
+        self.captured = captured
+
+
+class Tracer:
+    """Per-stage latency histograms plus a capture -> cursor move end-to-end histogram.
+
+    Stages report (started, finished) perf_counter pairs through record(). The
+    end-to-end latency runs from the moment the camera read returned to the
+    moment the input backend finished moving the cursor; exposure and driver
+    delay before the read returns are not visible from here. A summary line is
+    logged every log_interval seconds (0 disables it).
+    """
+
+    def __init__(self, stages: Sequence[str] = TRACE_STAGES, log_interval: float = TRACE_LOG_INTERVAL) -> None:
+        self.histograms: Dict[str, LatencyHistogram] = {name: LatencyHistogram() for name in stages}
+        self.histograms[END_TO_END] = LatencyHistogram()
+        self.log_interval = log_interval
+        self._last_log = time.monotonic()
+
+    def record(self, stage: str, started: float, finished: Optional[float] = None) -> float:
+        """Record a stage that ran from started to finished (default: now); returns finished."""
+        if finished is None:
+            finished = time.perf_counter()
+        self.histograms[stage].record(finished - started)
+        return finished
+
+    def injected(self, trace: FrameTrace, queued: float) -> None:
+        """Input backend callback: the cursor move for this frame has been applied."""
+        finished = self.record('injection', queued)
+        self.histograms[END_TO_END].record(finished - trace.captured)
+
+    def reset(self) -> None:
+        for histogram in self.histograms.values():
+            histogram.reset()
+        self._last_log = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {name: histogram.snapshot() for name, histogram in self.histograms.items()}
+
+    def summary(self, percentiles: Sequence[float] = (50.0, 99.0)) -> str:
+        parts = []
+        for name, histogram in self.histograms.items():
+            if histogram.total:
+                values = '/'.join(f'{histogram.percentile(p):.1f}' for p in percentiles)
+                parts.append(f'{name} {values}')
+        label = '/'.join(f'p{p:g}' for p in percentiles)
+        return f"Latency ms ({label}): " + (', '.join(parts) if parts else 'no samples')
+
+    def maybe_log(self) -> None:
+        if not self.log_interval:
+            return
+        now = time.monotonic()
+        if now - self._last_log >= self.log_interval:
+            self._last_log = now
+            logging.info(self.summary())
+
+    def overlay(self) -> str:
+        """Compact median latencies for drawing over the preview."""
+        short = {'capture': 'cap', 'inference': 'inf', 'smoothing': 'smo', 'classification': 'cls',
+                 'injection': 'inj', 'preview': 'pre', END_TO_END: 'e2e'}
+        return '  '.join(f'{short.get(name, name)} {histogram.percentile(50.0):.1f}'
+                         for name, histogram in self.histograms.items() if histogram.total) + ' ms'
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        try:
+            body = json.dumps(self.server.provider()).encode('utf-8')
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+class JsonEndpoint(ThreadingHTTPServer):
+    """Serves provider() as JSON on every GET, on localhost only, from a daemon thread."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port: int, provider: Callable[[], Dict[str, Any]]) -> None:
+        super().__init__((TRACE_HOST, port), JsonHandler)
+        self.provider = provider
+        self._thread = threading.Thread(target=self.serve_forever, name='trace-endpoint', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+        logging.info(f"Latency endpoint listening on http://{TRACE_HOST}:{self.server_address[1]}/")
+
+    def close(self) -> None:
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,204 @@
+import abc
+import time
+import logging
+import threading
+from typing import Optional, Tuple
+
+VOLUME_THRESHOLD = 0.01
+VOLUME_HYSTERESIS = 0.03
+VOLUME_MAX_RATE = 10.0
+
+
+class VolumeBackend(abc.ABC):
+    """Interface to the system master volume, in decibels."""
+
+    def open(self) -> None:
+        """Prepare the backend on the thread that will use it."""
+
+    def close(self) -> None:
+        """Release per-thread resources acquired in open()."""
+
+    @abc.abstractmethod
+    def volume_range(self) -> Tuple[float, float]:
+        pass
+
+    @abc.abstractmethod
+    def get_level(self) -> float:
+        """Current level, read once when the controller starts."""
+
+    @abc.abstractmethod
+    def set_level(self, level: float) -> None:
+        pass
+
+
+class PycawVolumeBackend(VolumeBackend):
+    """Windows master volume through the pycaw IAudioEndpointVolume COM interface.
+
+    COM objects belong to the apartment of the thread that created them, so
+    the endpoint is only activated in open(), on the thread that uses it, and
+    dropped again in close().
+    """
+
+    def __init__(self) -> None:
+        import pythoncom
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+        self._pythoncom = pythoncom
+        self._clsctx = CLSCTX_ALL
+        self._utilities = AudioUtilities
+        self._interface = IAudioEndpointVolume
+        self._volume = None
+        self._range: Tuple[float, float] = (0.0, 0.0)
+
+    def open(self) -> None:
+        self._pythoncom.CoInitialize()
+        try:
+            devices = self._utilities.GetSpeakers()
+            interface = devices.Activate(self._interface._iid_, self._clsctx, None)
+            self._volume = interface.QueryInterface(self._interface)
+            self._range = tuple(self._volume.GetVolumeRange()[:2])
+        except Exception:
+            self._volume = None
+            self._pythoncom.CoUninitialize()
+            raise
+
+    def close(self) -> None:
+        self._volume = None
+        self._pythoncom.CoUninitialize()
+
+    def volume_range(self) -> Tuple[float, float]:
+        return self._range
+
+    def get_level(self) -> float:
+        return self._volume.GetMasterVolumeLevel()
+
+    def set_level(self, level: float) -> None:
+        self._volume.SetMasterVolumeLevel(level, None)
+
+
+class MemoryVolumeBackend(VolumeBackend):
+    """Pure-Python stand-in that keeps the level in memory and counts writes."""
+
+    def __init__(self, level: float = 0.0, volume_range: Tuple[float, float] = (-65.25, 0.0)) -> None:
+        self.level = level
+        self.range = volume_range
+        self.writes: int = 0
+
+    def volume_range(self) -> Tuple[float, float]:
+        return self.range
+
+    def get_level(self) -> float:
+        return self.level
+
+    def set_level(self, level: float) -> None:
+        self.level = level
+        self.writes += 1
+
+
+class VolumeController:
+    """Applies requested volume levels from a worker thread, only when they really change.
+
+    Levels are requested as a fraction of the backend's range. The newest request
+    wins, at most max_rate writes happen per second, changes smaller than
+    threshold are ignored, and reversing direction needs a change of at least
+    hysteresis so a hand hovering on a boundary doesn't flap the volume. The
+    level the system is already at counts as applied, so a first request
+    close to it is not written either.
+    """
+
+    def __init__(self, backend: VolumeBackend, threshold: float = VOLUME_THRESHOLD,
+                 hysteresis: float = VOLUME_HYSTERESIS, max_rate: float = VOLUME_MAX_RATE) -> None:
+        self.backend = backend
+        self.threshold = threshold
+        self.hysteresis = hysteresis
+        self.interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.applied: Optional[float] = None
+        self.requests: int = 0
+        self.writes: int = 0
+        self._direction = 0
+        self._pending: Optional[float] = None
+        self._last_write: float = 0.0
+        self._running = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name='volume-worker', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def set_fraction(self, fraction: float) -> None:
+        """Request a volume level between 0.0 (min) and 1.0 (max)."""
+        with self._cond:
+            self._pending = min(max(fraction, 0.0), 1.0)
+            self.requests += 1
+            self._cond.notify()
+
+    def should_apply(self, target: float) -> bool:
+        if self.applied is None:
+            return True
+        delta = target - self.applied
+        direction = (delta > 0) - (delta < 0)
+        needed = self.hysteresis if direction and self._direction and direction != self._direction else self.threshold
+        return abs(delta) >= needed
+
+    def _apply(self, target: float, volume_range: Tuple[float, float]) -> bool:
+        if not self.should_apply(target):
+            return False
+        if self.applied is not None and target != self.applied:
+            self._direction = 1 if target > self.applied else -1
+        low, high = volume_range
+        self.backend.set_level(low + target * (high - low))
+        self.applied = target
+        self.writes += 1
+        return True
+
+    def _seed(self, volume_range: Tuple[float, float]) -> None:
+        low, high = volume_range
+        if high <= low:
+            return
+        try:
+            level = self.backend.get_level()
+        except Exception as e:
+            logging.warning(f"Could not read the current volume: {e}")
+            return
+        self.applied = min(max((level - low) / (high - low), 0.0), 1.0)
+
+    def _run(self) -> None:
+        try:
+            self.backend.open()
+        except Exception as e:
+            logging.error(f"Could not open the volume backend: {e}")
+            return
+        try:
+            volume_range = self.backend.volume_range()
+            self._seed(volume_range)
+            while True:
+                with self._cond:
+                    while self._running and self._pending is None:
+                        self._cond.wait()
+                    if not self._running:
+                        return
+                    wait = self._last_write + self.interval - time.monotonic()
+                    if wait > 0:
+                        self._cond.wait(wait)
+                        continue
+                    target, self._pending = self._pending, None
+                try:
+                    if self._apply(target, volume_range):
+                        self._last_write = time.monotonic()
+                except Exception as e:
+                    logging.error(f"Failed to set the volume: {e}")
+        finally:
+            self.backend.close()
@@ -0,0 +1,78 @@
+import time
+import unittest
+from Volume import MemoryVolumeBackend, VolumeBackend, VolumeController
+
+
+def wait_for(predicate, timeout: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class VolumeControllerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.backend = MemoryVolumeBackend(volume_range=(-60.0, 0.0))
+        self.controller = VolumeController(self.backend, max_rate=20.0)
+
+    def tearDown(self) -> None:
+        self.controller.stop()
+
+    def test_pending_requests_are_coalesced(self) -> None:
+        for i in range(1, 10):
+            self.controller.set_fraction(i / 10)
+        self.controller.start()
+        self.assertTrue(wait_for(lambda: self.controller.applied == 0.9))
+        self.assertEqual(self.controller.requests, 9)
+        self.assertEqual(self.backend.writes, 1)
+        self.assertAlmostEqual(self.backend.level, -6.0)
+
+    def test_writes_are_rate_limited(self) -> None:
+        self.controller.start()
+        self.controller.set_fraction(0.2)
+        self.assertTrue(wait_for(lambda: self.controller.applied == 0.2))
+        self.controller.set_fraction(0.4)
+        self.controller.set_fraction(0.6)
+        self.assertTrue(wait_for(lambda: self.controller.applied == 0.6))
+        self.assertEqual(self.backend.writes, 2)
+        self.assertEqual(self.controller.writes, 2)
+
+    def test_small_changes_and_reversals_are_ignored(self) -> None:
+        self.backend.level = -60.0  # start at the bottom so 0.5 -> 0.52 keeps the direction
+        self.controller.start()
+        self.controller.set_fraction(0.5)
+        self.assertTrue(wait_for(lambda: self.controller.applied == 0.5))
+        self.controller.set_fraction(0.52)
+        self.assertTrue(wait_for(lambda: self.controller.applied == 0.52))
+        self.assertFalse(self.controller.should_apply(0.525))
+        self.assertFalse(self.controller.should_apply(0.5))
+        self.assertTrue(self.controller.should_apply(0.48))
+        self.assertTrue(self.controller.should_apply(0.535))
+
+    def test_current_level_counts_as_applied(self) -> None:
+        self.backend.level = -30.0
+        self.controller.set_fraction(0.505)
+        self.controller.start()
+        self.assertTrue(wait_for(lambda: self.controller.applied == 0.5))
+        self.controller.set_fraction(0.6)
+        self.assertTrue(wait_for(lambda: self.controller.applied == 0.6))
+        self.assertEqual(self.backend.writes, 1)
+        self.assertAlmostEqual(self.backend.level, -24.0)
+
+    def test_backend_must_implement_every_method(self) -> None:
+        class ReadOnlyBackend(VolumeBackend):
+            def volume_range(self):
+                return -60.0, 0.0
+
+            def get_level(self) -> float:
+                return 0.0
+
+        with self.assertRaises(TypeError):
+            ReadOnlyBackend()
+
+
+if __name__ == '__main__':
+    unittest.main()